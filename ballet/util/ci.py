@@ -1,3 +1,4 @@
+import logging
 import os
 from typing import Dict, Iterable, Optional
 
@@ -12,12 +13,13 @@ from ballet.util.log import logger
 
 def in_travis() -> bool:
     """Check if we are in Travis right now"""
-    return len(get_travis_env_vars()) > 0
+    return any(k.startswith('TRAVIS') for k in os.environ)
 
 
 def get_travis_env_or_fail(name: str) -> str:
-    if name in os.environ:
-        return os.environ[name]
+    value = os.environ.get(name)
+    if value is not None:
+        return value
     else:
         # dump_travis_env_vars()
         raise UnexpectedTravisEnvironmentError(
@@ -25,7 +27,8 @@ def get_travis_env_or_fail(name: str) -> str:
 
 
 def ensure_expected_travis_env_vars(names: Iterable[str]):
-    if not set(names).issubset(set(os.environ.keys())):
+    environ = os.environ
+    if not all(name in environ for name in names):
         raise UnexpectedTravisEnvironmentError
 
 
@@ -37,7 +40,8 @@ def get_travis_env_vars() -> Dict[str, str]:
 
 
 def dump_travis_env_vars():
-    logger.info(repr(get_travis_env_vars()))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(repr(get_travis_env_vars()))
 
 
 # TODO delete
@@ -127,16 +131,18 @@ class TravisPullRequestBuildDiffer(PullRequestBuildDiffer):
 
     def __init__(self, repo: git.Repo = None):
         super().__init__(repo)
+        # the environment has been checked, so read what we need once
+        self.commit_range = get_travis_env_or_fail('TRAVIS_COMMIT_RANGE')
         if repo is None:
-            repo = self._detect_repo()
+            self.repo = self._detect_repo()
 
     def _check_environment(self):
         ensure_expected_travis_env_vars(
             TravisPullRequestBuildDiffer.EXPECTED_TRAVIS_ENV_VARS)
 
     def _get_diff_endpoints(self):
-        commit_range = get_travis_env_or_fail('TRAVIS_COMMIT_RANGE')
-        return get_diff_endpoints_from_commit_range(self.repo, commit_range)
+        return get_diff_endpoints_from_commit_range(
+            self.repo, self.commit_range)
 
     def _detect_repo(self) -> git.Repo:
         build_dir = get_travis_env_or_fail('TRAVIS_BUILD_DIR')
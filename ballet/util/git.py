@@ -1,13 +1,17 @@
 import pathlib
 import re
-from typing import Iterable, Iterator, Optional, Tuple
+from collections import Counter, OrderedDict
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
 
 import git
 import requests
-from funcy import collecting, complement, lfilter, re_find, silent
+from funcy import re_find, silent
 from github import Github
 from github.Repository import Repository
+from requests.adapters import HTTPAdapter
 from stacklog import stacklog
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 from ballet.exc import BalletError
 from ballet.util import one_or_raise
@@ -24,6 +28,16 @@ GIT_PUSH_FAILURE = (
     git.PushInfo.ERROR
 )
 DEFAULT_BRANCH = 'master'
+GITHUB_API_HEADERS = {
+    'Accept': 'application/vnd.github.v3+json',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+GITHUB_API_TIMEOUT = 30
+_session: Optional[requests.Session] = None
+# pages of pull requests by request, evicting the least recently used pages
+# beyond _PULL_REQUESTS_CACHE_MAXSIZE
+_PULL_REQUESTS_CACHE_MAXSIZE = 256
+_pull_requests_cache: 'OrderedDict[tuple, _PullRequestsPage]' = OrderedDict()
 
 
 class Differ:
@@ -189,6 +203,7 @@ def get_diff_endpoints_from_commit_range(
 
 
 def get_repo(repo: Optional[git.Repo] = None) -> git.Repo:
+    """Get the repo, defaulting to the one containing the cwd"""
     if repo is None:
         repo = git.Repo(pathlib.Path.cwd(),
                         search_parent_directories=True)
@@ -225,34 +240,112 @@ def set_config_variables(repo: git.Repo, variables: dict):
         writer.release()
 
 
-def get_pull_requests(owner: str, repo: str, state: str = 'closed') -> dict:
+def _get_session() -> requests.Session:
+    """Get the shared session, which keeps connections alive across calls"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        retry = Retry(
+            total=5, backoff_factor=0.25, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_maxsize=32, max_retries=retry)
+        _session.mount('http://', adapter)
+        _session.mount('https://', adapter)
+    return _session
+
+
+class _PullRequestsPage(NamedTuple):
+    etag: str
+    prs: list
+    has_next: bool
+
+
+def _request_pull_requests(
+    owner: str, repo: str, state: str, page: int = 1
+) -> Tuple[list, bool]:
+    """Request one page of pull requests
+
+    Pages are cached by their ETag. When the cached page is still current,
+    GitHub responds with 304 Not Modified, which has no body and does not
+    count against the rate limit.
+
+    Returns:
+        list of pull requests and whether there is a next page
+    """
     base = 'https://api.github.com'
     q = f'/repos/{owner}/{repo}/pulls'
     url = base + q
-    headers = {
-        'Accept': 'application/vnd.github.v3+json'
-    }
     params = {
         'state': state,
         'base': 'master',
         'sort': 'created',
         'direction': 'asc',
+        'page': page,
     }
-    res = requests.get(url, headers=headers, params=params)
+    key = (owner, repo, state, page)
+    cached = _pull_requests_cache.get(key)
+    headers = GITHUB_API_HEADERS
+    if cached is not None:
+        headers = {**headers, 'If-None-Match': cached.etag}
+
+    res = _get_session().get(url, headers=headers, params=params,
+                             timeout=GITHUB_API_TIMEOUT)
+    if cached is not None and res.status_code == 304:
+        _pull_requests_cache.move_to_end(key)
+        # copy, so that callers cannot modify the cached page
+        return list(cached.prs), cached.has_next
     res.raise_for_status()
-    return res.json()
+
+    prs = res.json()
+    has_next = 'next' in res.links
+    etag = res.headers.get('ETag')
+    if etag is not None:
+        _pull_requests_cache[key] = _PullRequestsPage(etag, prs, has_next)
+        _pull_requests_cache.move_to_end(key)
+        if len(_pull_requests_cache) > _PULL_REQUESTS_CACHE_MAXSIZE:
+            _pull_requests_cache.popitem(last=False)
+        prs = list(prs)
+    return prs, has_next
+
+
+def get_pull_requests(owner: str, repo: str, state: str = 'closed') -> list:
+    prs, _ = _request_pull_requests(owner, repo, state)
+    return prs
+
+
+def iter_pull_requests(
+    owner: str, repo: str, state: str = 'closed'
+) -> Iterator[dict]:
+    """Iterate over all pull requests, requesting one page at a time"""
+    page = 1
+    while True:
+        prs, has_next = _request_pull_requests(owner, repo, state, page=page)
+        yield from prs
+        if not has_next:
+            break
+        page += 1
 
 
-@collecting
 def get_pull_request_outcomes(owner: str, repo: str) -> Iterator[str]:
-    prs = get_pull_requests(owner, repo, state='closed')
-    for pr in prs:
+    """Iterate over the outcomes of closed pull requests
+
+    Each outcome is either ``'accepted'`` (merged) or ``'rejected'``.
+    """
+    for pr in iter_pull_requests(owner, repo, state='closed'):
         if pr['merged_at'] is not None:
             yield 'accepted'
         else:
             yield 'rejected'
 
 
+def count_pull_request_outcomes(owner: str, repo: str) -> Counter:
+    """Count the outcomes of closed pull requests
+
+    Returns:
+        counter with keys ``'accepted'`` and/or ``'rejected'``
+    """
+    return Counter(get_pull_request_outcomes(owner, repo))
+
+
 def did_git_push_succeed(push_info: git.remote.PushInfo) -> bool:
     """Check whether a git push succeeded
 
@@ -309,7 +402,11 @@ def push_branches_to_remote(
         f'{b}:{b}'
         for b in branches
     ])
-    failures = lfilter(complement(did_git_push_succeed), result)
+    failures = [
+        push_info
+        for push_info in result
+        if push_info.flags & GIT_PUSH_FAILURE
+    ]
     if failures:
         for push_info in failures:
             logger.error(
@@ -6,17 +6,22 @@ from typing import Union
 import h5py
 import numpy as np
 import pandas as pd
-from stacklog import stacklog
 
 from ballet.util.fs import splitext2
-from ballet.util.log import logger
+from ballet.util.log import logger, stacklog_if_enabled
 from ballet.util.typing import Pathy
 
-
-def _check_ext(ext: str, expected: str):
-    if ext != expected:
-        raise ValueError(
-            f'File path has wrong extension: {ext} (expected {expected})')
+# lightweight compression settings for HDF5 output; shuffling the bytes of
+# numeric data first makes it compress much better
+H5PY_COMPRESSION_KWARGS = {
+    'compression': 'lzf',
+    'shuffle': True,
+    'chunks': True,
+}
+PANDAS_HDF_COMPRESSION_KWARGS = {
+    'complib': 'blosc:lz4',
+    'complevel': 5,
+}
 
 
 def write_tabular(obj: Union[np.ndarray, pd.DataFrame], filepath: Pathy):
@@ -26,9 +31,10 @@ def write_tabular(obj: Union[np.ndarray, pd.DataFrame], filepath: Pathy):
         obj: tabular object to write
         filepath: path to write to; must end in '.h5' or '.pkl'
     """
+    filepath = os.fspath(filepath)
     _, fn, ext = splitext2(filepath)
     if ext == '.h5':
-        _write_tabular_h5(obj, filepath)
+        _write_tabular_h5(obj, filepath, fn)
     elif ext == '.pkl':
         _write_tabular_pickle(obj, filepath)
     else:
@@ -36,25 +42,25 @@ def write_tabular(obj: Union[np.ndarray, pd.DataFrame], filepath: Pathy):
 
 
 def _write_tabular_pickle(obj, filepath):
-    _, fn, ext = splitext2(filepath)
-    _check_ext(ext, '.pkl')
     if isinstance(obj, np.ndarray):
+        # protocol 4 supports large arrays and, unlike protocol 5, can be
+        # read on Python 3.7
         with open(filepath, 'wb') as f:
-            pickle.dump(obj, f)
+            pickle.dump(obj, f, protocol=4)
     elif isinstance(obj, pd.core.frame.NDFrame):
         obj.to_pickle(filepath)
     else:
         raise NotImplementedError
 
 
-def _write_tabular_h5(obj, filepath):
-    _, fn, ext = splitext2(filepath)
-    _check_ext(ext, '.h5')
+def _write_tabular_h5(obj, filepath, fn):
     if isinstance(obj, np.ndarray):
+        # scalar datasets don't support chunk/filter options
+        kwargs = H5PY_COMPRESSION_KWARGS if obj.ndim else {}
         with h5py.File(filepath, 'w') as hf:
-            hf.create_dataset(fn, data=obj)
+            hf.create_dataset(fn, data=obj, **kwargs)
     elif isinstance(obj, pd.core.frame.NDFrame):
-        obj.to_hdf(filepath, key=fn)
+        obj.to_hdf(filepath, key=fn, **PANDAS_HDF_COMPRESSION_KWARGS)
     else:
         raise NotImplementedError
 
@@ -65,18 +71,17 @@ def read_tabular(filepath: Pathy):
     Args:
         filepath: path to read to; must end in '.h5' or '.pkl'
     """
+    filepath = os.fspath(filepath)
     _, fn, ext = splitext2(filepath)
     if ext == '.h5':
-        return _read_tabular_h5(filepath)
+        return _read_tabular_h5(filepath, fn)
     elif ext == '.pkl':
         return _read_tabular_pickle(filepath)
     else:
         raise NotImplementedError
 
 
-def _read_tabular_h5(filepath):
-    _, fn, ext = splitext2(filepath)
-    _check_ext(ext, '.h5')
+def _read_tabular_h5(filepath, fn):
     with h5py.File(filepath, 'r') as hf:
         dataset = hf[fn]
         data = dataset[:]
@@ -84,8 +89,6 @@ def _read_tabular_h5(filepath):
 
 
 def _read_tabular_pickle(filepath):
-    _, fn, ext = splitext2(filepath)
-    _check_ext(ext, '.pkl')
     with open(filepath, 'rb') as f:
         return pickle.load(f)
 
@@ -111,8 +114,9 @@ def save_targets(y, output_dir, name='target'):
 
 
 def _save_thing(thing, output_dir, name, savefn=write_tabular):
-    fn = pathlib.Path(output_dir).joinpath(f'{name}.pkl')
-    with stacklog(logger.info, f'Saving {name} to {fn}'):
+    output_dir = os.fspath(output_dir)
+    fn = os.path.join(output_dir, name + '.pkl')
+    with stacklog_if_enabled(logger.info, f'Saving {name} to {fn}'):
         os.makedirs(output_dir, exist_ok=True)
         savefn(thing, fn)
 
@@ -1,21 +1,51 @@
+import atexit
 import logging
-from typing import Optional, Union
+import logging.handlers
+import queue
+from typing import Dict, Optional, Union
 
-import ballet
+from stacklog import stacklog
 
 TRACE = 7
 SIMPLE_LOG_FORMAT = r'%(levelname)s - %(message)s'
 DETAIL_LOG_FORMAT = r'[%(asctime)s] {%(name)s: %(filename)s:%(lineno)d} %(levelname)s - %(message)s'  # noqa E501
 
 logging.addLevelName(TRACE, 'TRACE')
-logger = logging.getLogger(ballet.__name__)
+logger = logging.getLogger('ballet')
 _handler = None
+_buffered_handler = None
+_queue_handler = None
+_queue_listener = None
+
+# resolve the standard levels once, rather than on every call to enable
+_LEVEL_NAMES: Dict[int, str] = {
+    level: logging.getLevelName(level)
+    for level in (logging.CRITICAL, logging.ERROR, logging.WARNING,
+                  logging.INFO, logging.DEBUG, TRACE)
+}
+_LEVEL_INTS: Dict[Union[str, int], int] = {
+    **{name: level for level, name in _LEVEL_NAMES.items()},
+    **{level: level for level in _LEVEL_NAMES},
+}
+
+
+def _stop_queue_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def enable(logger: Union[str, logging.Logger] = logger,
            level: Union[str, int] = logging.INFO,
            format: str = SIMPLE_LOG_FORMAT,
-           echo: bool = True):
+           echo: bool = True,
+           buffered: bool = False,
+           capacity: int = 1024,
+           async_: bool = False):
     """Enable simple console logging for this module
 
     Args:
@@ -25,27 +55,74 @@ def enable(logger: Union[str, logging.Logger] = logger,
         format : logging format. Defaults to :py:const:`SIMPLE_LOG_FORMAT`.
         echo: Whether to log a message at the configured log level to
             confirm that logging is enable. Defaults to True.
+        buffered: Whether to buffer log records in memory and write them
+            to the console in batches, which reduces the number of writes
+            when logging heavily. Records are written when the buffer is
+            full, when a record at level ERROR or above is logged, and at
+            exit. Defaults to False.
+        capacity: number of records to buffer if ``buffered``. Defaults to
+            1024.
+        async_: Whether to hand log records off to a queue that is
+            processed by a background thread, so that the caller does not
+            wait on formatting and writing records. Cannot be combined with
+            ``buffered``. Defaults to False.
     """
     if isinstance(logger, str):
         logger = logging.getLogger(logger)
 
-    global _handler
+    if buffered and async_:
+        raise ValueError('Only one of buffered and async_ can be enabled')
+
+    global _handler, _buffered_handler, _queue_handler, _queue_listener
     if _handler is None:
         _handler = logging.StreamHandler()
         _handler.setFormatter(logging.Formatter(format))
 
+    handler: logging.Handler = _handler
+    if buffered:
+        if _buffered_handler is None:
+            _buffered_handler = logging.handlers.MemoryHandler(
+                capacity, flushLevel=logging.ERROR, target=_handler)
+        _buffered_handler.capacity = capacity
+        handler = _buffered_handler
+    elif async_:
+        if _queue_handler is None:
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            _queue_handler = logging.handlers.QueueHandler(q)
+        if _queue_listener is None:
+            _queue_listener = logging.handlers.QueueListener(
+                _queue_handler.queue, _handler, respect_handler_level=True)
+            _queue_listener.start()
+        handler = _queue_handler
+
     if isinstance(level, str):
         level = level.upper()
-    levelInt: int = logging._checkLevel(level)  # type: ignore
-    levelName: str = logging.getLevelName(levelInt)
+    levelInt = _LEVEL_INTS.get(level)
+    if levelInt is None:
+        levelInt = logging._checkLevel(level)  # type: ignore
+    levelName = _LEVEL_NAMES.get(levelInt)
+    if levelName is None:
+        levelName = logging.getLevelName(levelInt)
 
-    logger.setLevel(levelName)
+    # setting the level clears the cache of every logger, so avoid doing so
+    # when enable is called again with the same level
+    if logger.level != levelInt:
+        logger.setLevel(levelInt)
     # _handler.setLevel(levelName)  # might defeat the point
 
-    if _handler not in logger.handlers:
-        logger.addHandler(_handler)
+    # only one of the plain, buffered, or queue handlers should be attached
+    for other in (_handler, _buffered_handler, _queue_handler):
+        if other is not handler and other in logger.handlers:
+            logger.removeHandler(other)
+    if handler not in logger.handlers:
+        logger.addHandler(handler)
 
-    if echo:
+    # stop the background thread once the queue handler has been replaced,
+    # which also writes out any records still in the queue
+    if handler is not _queue_handler:
+        _stop_queue_listener()
+
+    if echo and logger.isEnabledFor(levelInt):
         logger.log(levelInt, f'Logging enabled at level {levelName}.')
 
 
@@ -64,13 +141,14 @@ class LevelFilter:
         >>> logger.addFilter(debugFilter)
     """
 
+    __slots__ = ('_level', )
+
     def __init__(self, level: int):
-        self.__level = level
+        self._level = level
 
-    def filter(self, logRecord: logging.LogRecord) -> int:
-        # Is the specified record to be logged? Returns zero for no, nonzero
-        # for yes.
-        return 1 if logRecord.levelno == self.__level else 0
+    def filter(self, logRecord: logging.LogRecord) -> bool:
+        # Is the specified record to be logged?
+        return logRecord.levelno == self._level
 
 
 class LoggingContext:
@@ -101,6 +179,8 @@ class LoggingContext:
     Source: <https://docs.python.org/3/howto/logging-cookbook.html#using-a-context-manager-for-selective-logging>
     """  # noqa E501
 
+    __slots__ = ('logger', 'level', 'handler', 'close', 'old_level')
+
     def __init__(self,
                  logger: logging.Logger,
                  level: Union[str, int, None] = None,
@@ -112,17 +192,67 @@ class LoggingContext:
         self.close = close
 
     def __enter__(self):
-        if self.level is not None:
-            self.old_level = self.logger.level
-            self.logger.setLevel(self.level)
-        if self.handler is not None:
-            self.logger.addHandler(self.handler)
+        logger, level, handler = self.logger, self.level, self.handler
+        if level is not None:
+            self.old_level = logger.level
+            logger.setLevel(level)
+        if handler is not None:
+            logger.addHandler(handler)
 
     def __exit__(self, et, ev, tb):
-        if self.level is not None:
-            self.logger.setLevel(self.old_level)
-        if self.handler is not None:
-            self.logger.removeHandler(self.handler)
-        if self.handler and self.close:
-            self.handler.close()
+        logger, level, handler = self.logger, self.level, self.handler
+        if level is not None:
+            logger.setLevel(self.old_level)
+        if handler is not None:
+            logger.removeHandler(handler)
+            if self.close:
+                handler.close()
+
+
+# levels of the logging methods of logging.Logger, for stacklog_if_enabled
+_METHOD_LEVELS: Dict[str, int] = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'exception': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+
+class _NoOpContext:
+    __slots__ = ()
+
+    def __enter__(self):
         return None
+
+    def __exit__(self, et, ev, tb):
+        return False
+
+
+_NOOP_CONTEXT = _NoOpContext()
+
+
+def stacklog_if_enabled(method, message: str, *args, **kwargs):
+    """Stack log messages, unless the logger would discard them anyway
+
+    If ``method`` is a logging method of a :py:class:`logging.Logger`, such
+    as ``logger.debug``, and the logger is not enabled for that level, a
+    no-op context manager is returned instead of a
+    :py:class:`stacklog.stacklog`. Otherwise, arguments are passed through
+    to ``stacklog`` unchanged.
+
+    The level is checked when this function is called, so it should be used
+    as a context manager, not as a decorator applied at import time.
+
+    Example usage:
+
+        >>> with stacklog_if_enabled(logger.debug, 'Doing work'):
+        ...     do_work()
+    """
+    logger = getattr(method, '__self__', None)
+    if isinstance(logger, logging.Logger):
+        level = _METHOD_LEVELS.get(getattr(method, '__name__', None))
+        if level is not None and not logger.isEnabledFor(level):
+            return _NOOP_CONTEXT
+    return stacklog(method, message, *args, **kwargs)
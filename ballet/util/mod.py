@@ -1,8 +1,12 @@
 import importlib
+import os
 import pathlib
 import pkgutil
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from types import ModuleType
-from typing import Optional
+from typing import Optional, Tuple
 
 from ballet.util.log import logger
 from ballet.util.typing import Pathy
@@ -19,9 +23,39 @@ def import_module_from_relpath(path: Pathy) -> ModuleType:
     return import_module_from_modname(modname)
 
 
-def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
+def _has_init(dir: str) -> bool:
+    return os.path.isfile(os.path.join(dir, '__init__.py'))
+
+
+# modules loaded by import_module_at_path, keyed by module name and resolved
+# path, along with the (mtime, size) of their source file when loaded. The
+# least recently used entries are evicted beyond _IMPORTED_MODULES_MAXSIZE.
+_IMPORTED_MODULES_MAXSIZE = 128
+_ImportedModule = Tuple[Tuple[int, int], ModuleType]
+_imported_modules: 'OrderedDict[Tuple[str, str], _ImportedModule]' = \
+    OrderedDict()
+
+
+def _source_signature(source: pathlib.Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = source.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def import_module_at_path(
+    modname: str, modpath: Pathy, use_cache: bool = True
+) -> ModuleType:
     """Import module from path that may not be on system path
 
+    Modules are cached, and a module is executed again only if the
+    modification time or size of its source file has changed. Changes to
+    other files, such as sibling modules, and same-size edits within the
+    filesystem's timestamp granularity are not detected, in which case the
+    cached module and any state in it, such as already-fitted features, is
+    returned. Pass ``use_cache=False`` to always execute the module.
+
     Args:
         modname: module name from package root, e.g. foo.bar
         modpath: absolute path to module itself,
@@ -29,6 +63,8 @@ def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
             package, then the path should be specified as '/home/user/foo' and
             a file '/home/user/foo/__init__.py' *must be present* or the import
             will fail.
+        use_cache: whether to return the cached module if its source file is
+            unchanged
 
     Examples:
         >>> modname = 'foo.bar.baz'
@@ -53,9 +89,6 @@ def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
     def is_package(modpath):
         return modpath.suffix != '.py'
 
-    def has_init(dir):
-        return dir.joinpath('__init__.py').is_file()
-
     def has_package_structure(modname, modpath):
         modparts = modname.split('.')
         n = len(modparts)
@@ -64,7 +97,7 @@ def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
             n = n - 1
             dir = dir.parent
         while n > 0:
-            if not has_init(dir):
+            if not _has_init(str(dir)):
                 return False
             dir = dir.parent
             n = n - 1
@@ -74,6 +107,25 @@ def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
     if not has_package_structure(modname, modpath):
         raise ImportError('Module does not have valid package structure.')
 
+    # reuse the module if its source has not changed since it was loaded, as
+    # loading executes the module again
+    if is_package(modpath):
+        source = modpath / '__init__.py'
+    else:
+        source = modpath
+    key = (modname, str(modpath))
+    signature = _source_signature(source)
+    cached = _imported_modules.get(key)
+    if use_cache and signature is not None and cached is not None:
+        cached_signature, cached_mod = cached
+        # loading reuses the module object in sys.modules, so a same-named
+        # module loaded from another path may have since re-executed it
+        if (cached_signature == signature
+                and sys.modules.get(modname) is cached_mod
+                and getattr(cached_mod, '__file__', None) == str(source)):
+            _imported_modules.move_to_end(key)
+            return cached_mod
+
     parentpath = str(pathlib.Path(modpath).parent)
 
     finder = pkgutil.get_importer(parentpath)
@@ -93,6 +145,12 @@ def import_module_at_path(modname: str, modpath: Pathy) -> ModuleType:
     # TODO figure out what to do about this
     assert mod.__name__ == modname
 
+    if signature is not None:
+        _imported_modules[key] = (signature, mod)
+        _imported_modules.move_to_end(key)
+        if len(_imported_modules) > _IMPORTED_MODULES_MAXSIZE:
+            _imported_modules.popitem(last=False)
+
     return mod
 
 
@@ -111,6 +169,12 @@ def relpath_to_modname(relpath: Pathy) -> str:
         >>> relpath_to_modname('ballet/util/_util.py')
         'ballet.util._util'
     """
+    return _relpath_to_modname(os.fspath(relpath))
+
+
+@lru_cache(maxsize=2048)
+def _relpath_to_modname(relpath: str) -> str:
+    # the conversion is purely lexical, so results can be cached
     # don't try to resolve!
     p = pathlib.Path(relpath)
 
@@ -151,21 +215,20 @@ def modname_to_relpath(
             that are packages. Defaults to True
     """
     parts = modname.split('.')
-    relpath = pathlib.Path(*parts)
+    relpath = os.path.join(*parts)
 
     # is the module a package? if so, the relpath identifies a directory
     # it is easier to check for whether a file is a directory than to try to
     # import the module dynamically and see whether it is a package
     if project_root is not None:
-        relpath_resolved = pathlib.Path(project_root).joinpath(relpath)
+        relpath_resolved = os.path.join(project_root, relpath)
     else:
         relpath_resolved = relpath
 
-    is_dir = relpath_resolved.is_dir()
+    is_dir = os.path.isdir(relpath_resolved)
     if is_dir and add_init:
-        result = relpath.joinpath('__init__.py')
+        return os.path.join(relpath, '__init__.py')
     elif is_dir and not add_init:
-        result = relpath
+        return relpath
     else:
-        result = relpath.with_suffix('.py')
-    return str(result)
+        return relpath + '.py'
@@ -1,5 +1,6 @@
+import math
 import random
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from unittest.util import _common_shorten_repr
 
 import funcy
@@ -9,29 +10,69 @@ import pandas as pd
 import pandas.testing as pdt
 
 EPSILON = 1e-4
+MAX_SEED = 2**32 - 1
+_LOG10_1_5 = math.log10(1.5)
+
+
+class _Seeded:
+    __slots__ = ('seed', 'numpy', 'python', 'np_random_state',
+                 'random_state')
+
+    def __init__(self, seed, numpy=True, python=True):
+        self.seed = seed
+        self.numpy = numpy
+        self.python = python
+
+    def __enter__(self):
+        if self.numpy:
+            # the bit generator's own state dict, not the legacy tuple
+            self.np_random_state = np.random.get_state(legacy=False)
+            np.random.seed(self.seed)
+        if self.python:
+            self.random_state = random.getstate()
+            random.seed(self.seed)
+
+    def __exit__(self, et, ev, tb):
+        if self.numpy:
+            np.random.set_state(self.np_random_state)
+        if self.python:
+            random.setstate(self.random_state)
+
+
+_NOT_SEEDED = nullcontext()
 
 
-@funcy.contextmanager
 def seeded(seed):
     """Set seed, run code, then restore rng state"""
-    if seed is not None:
-        np_random_state = np.random.get_state()
-        random_state = random.getstate()
-        np.random.seed(seed)
-        random.seed(seed)
+    if seed is None:
+        return _NOT_SEEDED
+    return _Seeded(seed)
 
-    yield
 
-    if seed is not None:
-        np.random.set_state(np_random_state)
-        random.setstate(random_state)
+def seeded_numpy(seed):
+    """Like seeded, but only for numpy's global rng"""
+    if seed is None:
+        return _NOT_SEEDED
+    return _Seeded(seed, python=False)
+
+
+def seeded_random(seed):
+    """Like seeded, but only for the random module's global rng"""
+    if seed is None:
+        return _NOT_SEEDED
+    return _Seeded(seed, numpy=False)
+
+
+# draw fresh seeds from a private generator, so that doing so neither
+# advances nor depends on the global random state
+_seed_random = random.Random()
 
 
 @funcy.contextmanager
 def log_seed_on_error(logger, seed=None):
     """Store seed, run code, and report seed if error"""
     if seed is None:
-        seed = random.randint(0, 2**32 - 1)
+        seed = _seed_random.randint(0, MAX_SEED)
     try:
         with seeded(seed):
             yield
@@ -49,11 +90,50 @@ def _invert_assertion():
         raise AssertionError
 
 
+# dtype kinds for which numpy.testing's notion of equality (nans in the same
+# positions are equal) is exactly np.array_equal with equal_nan=True
+_EXACT_KINDS = frozenset('biuf')
+
+
+def _same_shape_arrays(first, second, kinds):
+    return (
+        type(first) is np.ndarray
+        and type(second) is np.ndarray
+        and first.shape == second.shape
+        and first.dtype.kind in kinds
+        and second.dtype.kind in kinds
+    )
+
+
+def _arrays_almost_equal(first, second, decimal):
+    """Compare float arrays as npt.assert_array_almost_equal does"""
+    nan = np.isnan(first)
+    if not np.array_equal(nan, np.isnan(second)):
+        return False
+    for inf in (np.inf, -np.inf):
+        if not np.array_equal(first == inf, second == inf):
+            return False
+    finite = ~(nan | np.isinf(first))
+    diff = np.abs(first[finite] - second[finite])
+    return bool((diff < 1.5 * 10.0 ** -decimal).all())
+
+
 def assert_array_equal(first, second):
+    # fast path for identical or equal numeric arrays; anything else,
+    # including arrays with nans, is left to numpy.testing
+    if (_same_shape_arrays(first, second, _EXACT_KINDS)
+            and (first is second or np.array_equal(first, second))):
+        return
+
     npt.assert_array_equal(first, second, verbose=False)
 
 
 def assert_array_not_equal(first, second):
+    if _same_shape_arrays(first, second, _EXACT_KINDS):
+        if np.array_equal(first, second, equal_nan=True):
+            raise AssertionError
+        return
+
     with _invert_assertion():
         npt.assert_array_equal(first, second, verbose=False)
 
@@ -84,7 +164,7 @@ def assert_array_almost_equal(first, second, places=6, delta=None):
     # => log10(delta/1.5) = -decimal
     # => decimal = -log10(delta) + log10(1.5)
     if delta is not None:
-        places = int(-np.log10(delta) + np.log10(1.5))
+        places = int(-math.log10(delta) + _LOG10_1_5)
 
     npt.assert_array_almost_equal(
         first, second, decimal=places, verbose=False)
@@ -95,7 +175,12 @@ def assert_array_not_almost_equal(
     """Test that arrays first and second are not almost equal"""
 
     if delta is not None:
-        places = int(-np.log10(delta) + np.log10(1.5))
+        places = int(-math.log10(delta) + _LOG10_1_5)
+
+    if _same_shape_arrays(first, second, 'f'):
+        if _arrays_almost_equal(first, second, places):
+            raise AssertionError
+        return
 
     with _invert_assertion():
         npt.assert_array_almost_equal(
@@ -138,51 +223,104 @@ def assert_index_not_equal(first, second, **kwargs):
         pdt.assert_index_equal, first, second, **kwargs)
 
 
-_is_pdobj = funcy.isa(pd.core.base.PandasObject)
+# the pandas objects that the assertions below know how to compare
+_PDOBJ_TYPES = (pd.DataFrame, pd.Series, pd.Index)
+
+# pandas objects, such as Categorical, that the assertions do not compare
+_UNSUPPORTED_PDOBJ_TYPES = (pd.api.extensions.ExtensionArray, )
+
+
+# objects with more elements than this are summarized by type and shape in
+# failure messages rather than repr'd in full
+_MAX_REPR_SIZE = 10_000
+
+
+class _Summary:
+    __slots__ = ('obj', )
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __repr__(self):
+        obj = self.obj
+        return f'<{type(obj).__name__} shape={obj.shape}>'
+
+
+def _is_large(obj):
+    # only arrays and pandas objects, as others may define size as a method
+    return (
+        isinstance(obj, (np.ndarray, *_PDOBJ_TYPES))
+        and obj.size > _MAX_REPR_SIZE
+    )
+
+
+def _shorten_repr(*args):
+    return _common_shorten_repr(*(
+        _Summary(arg) if _is_large(arg) else arg
+        for arg in args
+    ))
+
+
+def _lookup_pandas_assertion(assertions, cls):
+    for base in cls.__mro__:
+        func = assertions.get(base)
+        if func is not None:
+            return func
+    # unreachable?
+    raise AssertionError('you found a bug: unreachable code')
 
 
 def assert_pandas_object_equal(first, second, **kwargs):
     """Test that arbitrary Pandas objects first and second are equal"""
-    if _is_pdobj(first) and _is_pdobj(second):
+    if isinstance(first, _PDOBJ_TYPES) and isinstance(second, _PDOBJ_TYPES):
         if isinstance(first, type(second)):
-            if isinstance(first, pd.DataFrame):
-                assert_frame_equal(first, second, **kwargs)
-            elif isinstance(first, pd.Series):
-                assert_series_equal(first, second, **kwargs)
-            elif isinstance(first, pd.Index):
-                assert_index_equal(first, second, **kwargs)
-            else:
-                # unreachable?
-                raise AssertionError('you found a bug: unreachable code')
+            func = _lookup_pandas_assertion(
+                _PANDAS_EQUAL_ASSERTIONS, type(first))
+            func(first, second, **kwargs)
     else:
         msg = '{} and {} are uncomparable types'.format(
-            *_common_shorten_repr(first, second))
+            *_shorten_repr(first, second))
         raise AssertionError(msg)
 
 
 def assert_pandas_object_not_equal(first, second, **kwargs):
     """Test that arbitrary Pandas objects first and second are not equal"""
-    if _is_pdobj(first) and _is_pdobj(second):
+    if isinstance(first, _PDOBJ_TYPES) and isinstance(second, _PDOBJ_TYPES):
         if isinstance(first, type(second)):
-            if isinstance(first, pd.DataFrame):
-                assert_frame_not_equal(first, second, **kwargs)
-            elif isinstance(first, pd.Series):
-                assert_series_not_equal(first, second, **kwargs)
-            elif isinstance(first, pd.Index):
-                assert_index_not_equal(first, second, **kwargs)
-            else:
-                # unreachable?
-                raise AssertionError('you found a bug: unreachable code')
+            func = _lookup_pandas_assertion(
+                _PANDAS_NOT_EQUAL_ASSERTIONS, type(first))
+            func(first, second, **kwargs)
+    elif isinstance(first, _UNSUPPORTED_PDOBJ_TYPES) or isinstance(
+            second, _UNSUPPORTED_PDOBJ_TYPES):
+        # these could be equal, so don't pass them off as uncomparable
+        raise TypeError('{} and {} are unsupported types'.format(
+            *_shorten_repr(first, second)))
     else:
         # it's great that they are uncomparable types :)
         pass
 
 
+_PANDAS_EQUAL_ASSERTIONS = {
+    pd.DataFrame: assert_frame_equal,
+    pd.Series: assert_series_equal,
+    pd.Index: assert_index_equal,
+}
+_PANDAS_NOT_EQUAL_ASSERTIONS = {
+    pd.DataFrame: assert_frame_not_equal,
+    pd.Series: assert_series_not_equal,
+    pd.Index: assert_index_not_equal,
+}
+
+
 def _assert_pandas_equal(func, first, second, **kwargs):
     func(first, second, **kwargs)
 
 
 def _assert_pandas_not_equal(func, first, second, **kwargs):
+    # an object always equals itself, whatever the comparison options
+    if first is second:
+        raise AssertionError
+
     try:
         func(first, second, **kwargs)
     except AssertionError:
@@ -1,8 +1,10 @@
-from typing import Callable, List, TypeVar, Union
+from typing import TYPE_CHECKING, Callable, List, TypeVar, Union
 
-import ballet.eng  # noqa
 from ballet.compat import PathLike
 
+if TYPE_CHECKING:
+    import ballet.eng  # noqa
+
 T = TypeVar('T')
 OneOrMore = Union[T, List[T]]
 Pathy = Union[str, PathLike]
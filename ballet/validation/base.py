@@ -33,6 +33,9 @@ class FeaturePerformanceEvaluator(metaclass=ABCMeta):
         candidate_feature: the feature to evaluate
     """
 
+    __slots__ = ('X_df', 'y_df', 'X_df_val', 'y_val', 'features',
+                 'candidate_feature')
+
     def __init__(self,
                  X_df: pd.DataFrame,
                  y_df: Union[pd.DataFrame, pd.Series],
@@ -53,6 +56,8 @@ class FeaturePerformanceEvaluator(metaclass=ABCMeta):
 
 class FeatureAcceptanceMixin(metaclass=ABCMeta):
 
+    __slots__ = ()
+
     @abstractmethod
     def judge(self) -> bool:
         """Judge whether feature should be accepted"""
@@ -61,6 +66,8 @@ class FeatureAcceptanceMixin(metaclass=ABCMeta):
 
 class FeaturePruningMixin(metaclass=ABCMeta):
 
+    __slots__ = ()
+
     @abstractmethod
     def prune(self) -> List[Feature]:
         """Prune existing features, returning list of features to remove"""
@@ -69,12 +76,12 @@ class FeaturePruningMixin(metaclass=ABCMeta):
 
 class FeatureAccepter(FeatureAcceptanceMixin, FeaturePerformanceEvaluator):
     """Accept/reject a feature to the project based on its performance"""
-    pass
+    __slots__ = ()
 
 
 class FeaturePruner(FeaturePruningMixin, FeaturePerformanceEvaluator):
     """Prune features after acceptance based on their performance"""
-    pass
+    __slots__ = ()
 
 
 class BaseCheck(metaclass=ABCMeta):
@@ -1,12 +1,16 @@
+import logging
 import pathlib
+import posixpath
+from contextlib import contextmanager
+from functools import wraps
 from types import ModuleType
 from typing import (
     Callable, Collection, Iterator, List, NamedTuple, Optional, Sized, Tuple,
     Union,)
 
 import git
-from funcy import (
-    collecting, complement, lfilter, partial, post_processing, silent,)
+import numpy as np
+from funcy import collecting, partial, post_processing, silent
 from stacklog import stacklog
 
 from ballet.contrib import _collect_contrib_feature_from_module
@@ -14,7 +18,7 @@ from ballet.exc import (
     BalletError, FeatureCollectionError, NoFeaturesCollectedError,)
 from ballet.feature import Feature
 from ballet.project import Project
-from ballet.util import make_plural_suffix
+from ballet.util import RANDOM_STATE, make_plural_suffix
 from ballet.util.ci import TravisPullRequestBuildDiffer, can_use_travis_differ
 from ballet.util.git import (
     Differ, LocalMergeBuildDiffer, LocalPullRequestBuildDiffer, NoOpDiffer,
@@ -22,7 +26,7 @@ from ballet.util.git import (
 from ballet.util.log import logger
 from ballet.util.mod import (
     import_module_at_path, import_module_from_modname, relpath_to_modname,)
-from ballet.validation.base import FeaturePerformanceEvaluator
+from ballet.validation.base import BaseCheck, FeaturePerformanceEvaluator
 from ballet.validation.project_structure.checks import ProjectStructureCheck
 
 
@@ -73,19 +77,20 @@ def get_accepted_features(
         ballet.exc.BalletError: Could not deselect exactly the proposed
             feature.
     """
-    def eq(feature):
-        """Features are equal if they have the same source
-
-        At least in this implementation...
-        """
-        return feature.source == proposed_feature.source
-
-    # deselect features that match the proposed feature
-    result = lfilter(complement(eq), features)
+    # deselect features that match the proposed feature. features are equal
+    # if they have the same source, at least in this implementation...
+    proposed_source = proposed_feature.source
+    result = []
+    n_matches = 0
+    for feature in features:
+        if feature.source == proposed_source:
+            n_matches += 1
+        else:
+            result.append(feature)
 
-    if len(features) - len(result) == 1:
+    if n_matches == 1:
         return result
-    elif len(result) == len(features):
+    elif n_matches == 0:
         raise BalletError(
             'Did not find match for proposed feature within \'contrib\'')
     else:
@@ -172,8 +177,9 @@ class ChangeCollector:
         file_diffs = self.differ.diff()
 
         # log results
-        for i, file in enumerate(file_diffs):
-            logger.debug(f'File {i}: {file}')
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, file in enumerate(file_diffs):
+                logger.debug('File %d: %s', i, file)
 
         return file_diffs
 
@@ -187,35 +193,37 @@ class ChangeCollector:
         valid_init_diffs = []
         inadmissible_files = []
 
+        # the checkers only depend on the project, so create them once
+        checkers = make_checkers(ProjectStructureCheck, self.project)
         for diff in file_diffs:
-            valid, failures, _ = check_from_class(
-                ProjectStructureCheck, diff, self.project)
+            valid, failures, _ = run_checkers(checkers, diff)
             if valid:
-                if pathlib.Path(diff.b_path).parts[-1] != '__init__.py':
+                if posixpath.basename(diff.b_path) != '__init__.py':
                     candidate_feature_diffs.append(diff)
                     logger.debug(
-                        f'Categorized {diff.b_path} as '
-                        'CANDIDATE FEATURE MODULE')
+                        'Categorized %s as CANDIDATE FEATURE MODULE',
+                        diff.b_path)
                 else:
                     valid_init_diffs.append(diff)
                     logger.debug(
-                        f'Categorized {diff.b_path} as VALID INIT MODULE')
+                        'Categorized %s as VALID INIT MODULE', diff.b_path)
             else:
                 inadmissible_files.append(diff)
                 logger.debug(
-                    f'Categorized {diff.b_path} as INADMISSIBLE; '
-                    f'failures were {failures}')
-
-        logger.info(
-            'Admitted {n1} candidate feature{s1} '
-            'and {n2} __init__ module{s2} '
-            'and rejected {n3} file{s3}'
-            .format(n1=len(candidate_feature_diffs),
-                    s1=make_plural_suffix(candidate_feature_diffs),
-                    n2=len(valid_init_diffs),
-                    s2=make_plural_suffix(valid_init_diffs),
-                    n3=len(inadmissible_files),
-                    s3=make_plural_suffix(inadmissible_files)))
+                    'Categorized %s as INADMISSIBLE; failures were %s',
+                    diff.b_path, failures)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                'Admitted %d candidate feature%s '
+                'and %d __init__ module%s '
+                'and rejected %d file%s',
+                len(candidate_feature_diffs),
+                make_plural_suffix(candidate_feature_diffs),
+                len(valid_init_diffs),
+                make_plural_suffix(valid_init_diffs),
+                len(inadmissible_files),
+                make_plural_suffix(inadmissible_files))
 
         return candidate_feature_diffs, valid_init_diffs, inadmissible_files
 
@@ -250,32 +258,153 @@ class ChangeCollector:
 
         for diff in candidate_feature_diffs:
             path = diff.b_path
-            relpath = project_root.joinpath(path).relative_to(package_root)
-            modname = relpath_to_modname(relpath)
             modpath = project_root.joinpath(path)
-            importer = partial(import_module_at_path, modname, modpath)
+            relpath = modpath.relative_to(package_root)
+            modname = relpath_to_modname(relpath)
+            # always execute the proposed module, so that its features are
+            # validated fresh rather than with state from an earlier import
+            importer = partial(
+                import_module_at_path, modname, modpath, use_cache=False)
             yield NewFeatureInfo(importer, modname, modpath)
 
 
-def subsample_data_for_validation(*args):
-    return args
+# the number of rows kept when subsampling data for validation
+SUBSAMPLE_SIZE = 1000
+
+
+def subsample_data_for_validation(*args, size: int = SUBSAMPLE_SIZE):
+    """Subsample the rows of data for faster validation
+
+    Arguments with more than ``size`` rows are reduced to ``size`` rows,
+    drawn at random without replacement and kept in their original order.
+    Arguments with the same number of rows are subsampled at the same
+    positions, so that aligned entities and targets stay aligned. Arguments
+    that do not have rows, such as None, are returned unchanged. The sample
+    is deterministic.
+
+    This is meant for checking that features work, such as in feature API
+    validation, not for estimating their performance. Checks on individual
+    rows, such as for missing or infinite values, only see the sampled rows.
+
+    Args:
+        *args: data frames, series, or arrays to subsample
+        size: the maximum number of rows to keep
+
+    Returns:
+        tuple of subsampled args
+    """
+    positions = {}
+    result = []
+    for obj in args:
+        n = len(obj) if hasattr(obj, '__len__') else 0
+        if n <= size:
+            result.append(obj)
+            continue
+
+        if n not in positions:
+            rng = np.random.RandomState(RANDOM_STATE)
+            positions[n] = np.sort(rng.choice(n, size=size, replace=False))
+        index = positions[n]
+        if hasattr(obj, 'iloc'):
+            result.append(obj.iloc[index])
+        else:
+            result.append(obj[index])
+
+    return tuple(result)
+
+
+# results of functions decorated with share_result, keyed by the function and
+# the ids of its arguments, while inside shared_results; None when sharing is
+# not enabled
+_shared_results: Optional[dict] = None
+
+
+@contextmanager
+def shared_results():
+    """Share the results of share_result functions within this context
+
+    The results are discarded on exit, so later changes to the arguments are
+    seen.
+    """
+    global _shared_results
+    old_results = _shared_results
+    _shared_results = {}
+    try:
+        yield
+    finally:
+        _shared_results = old_results
+
+
+def share_result(func):
+    """Compute func once per set of argument objects within shared_results
+
+    Arguments are compared by identity, not equality, so this is meant for
+    expensive computations on objects that are not modified while sharing,
+    such as fitting a feature on a data frame. Outside of
+    :func:`shared_results`, func is always called.
+    """
+    @wraps(func)
+    def wrapper(*args):
+        results = _shared_results
+        if results is None:
+            return func(*args)
+
+        key = (func, *map(id, args))
+        if key not in results:
+            # keep the arguments alive along with the result, so that their
+            # ids cannot be reused by other objects while sharing
+            results[key] = (args, func(*args))
+        return results[key][1]
+
+    return wrapper
 
 
 def get_subclasses(cls):
     return cls.__subclasses__()
 
 
-def check_from_class(check_class: type, obj, *checker_args, **checker_kwargs):
+def check_from_class(
+    check_class: type,
+    obj,
+    *checker_args,
+    fail_fast: bool = False,
+    **checker_kwargs
+):
+    """Run all subclasses of check_class on obj
+
+    Checks run in the order their classes were defined, so cheap checks
+    should be defined before expensive ones. If ``fail_fast`` is True,
+    checking stops at the first failure, and only that failure and its
+    advice are reported.
+    """
+    checkers = make_checkers(check_class, *checker_args, **checker_kwargs)
+    return run_checkers(checkers, obj, fail_fast=fail_fast)
+
+
+def make_checkers(check_class: type, *checker_args, **checker_kwargs):
+    """Instantiate all subclasses of check_class, in definition order"""
+    return [
+        Checker(*checker_args, **checker_kwargs)
+        for Checker in get_subclasses(check_class)
+    ]
+
+
+def run_checkers(checkers: List[BaseCheck], obj, fail_fast: bool = False):
+    """Run already-instantiated checkers on obj
+
+    This allows the same checkers to be reused across many objects, such as
+    all file diffs in a change set. See :func:`check_from_class`.
+    """
     failures = []
     advice = []
-    for Checker in get_subclasses(check_class):
-        checker = Checker(*checker_args, **checker_kwargs)
-        check = checker.do_check
-        success = check(obj)
+    for checker in checkers:
+        success = checker.do_check(obj)
         if not success:
-            failures.append(Checker.__name__)
+            failures.append(checker.__class__.__name__)
             advice_item = silent(checker.give_advice)(obj)
             advice.append(advice_item)
+            if fail_fast:
+                break
 
     valid = not failures
     return valid, failures, advice
@@ -283,6 +412,8 @@ def check_from_class(check_class: type, obj, *checker_args, **checker_kwargs):
 
 class RandomFeaturePerformanceEvaluator(FeaturePerformanceEvaluator):
 
+    __slots__ = ('p', 'seed')
+
     def __init__(self, *args, p=0.3, seed=None):
         super().__init__(*args)
         self.p = p
@@ -3,8 +3,8 @@ from typing import Tuple
 
 import numpy as np
 import scipy.stats
-from scipy.special import digamma, gamma
-from sklearn.neighbors import NearestNeighbors
+from scipy.special import digamma, gammaln
+from sklearn.neighbors import KDTree, NearestNeighbors
 from sklearn.utils import check_consistent_length
 
 from ballet.util import asarray2d, nonnegative
@@ -52,16 +52,27 @@ def _compute_empirical_probability(
     return pk, events
 
 
-def _compute_volume_unit_ball(d: int, metric: str = NEIGHBORS_METRIC) -> float:
-    """Compute volume of a d-dimensional unit ball in R^d with given metric"""
+def _compute_log_volume_unit_ball(
+    d: int, metric: str = NEIGHBORS_METRIC
+) -> float:
+    """Compute log volume of a d-dimensional unit ball in R^d with given metric
+
+    Working in log space avoids the overflow of gamma(1 + d / 2) and the
+    underflow of the volume itself for high-dimensional data.
+    """
     if metric == 'chebyshev':
-        return 1.0
+        return 0.0
     elif metric == 'euclidean':
-        return np.power(np.pi, d / 2) / gamma(1 + d / 2) / 2**d
+        return d / 2 * np.log(np.pi) - gammaln(1 + d / 2) - d * np.log(2)
     else:
         raise ValueError(f'metric {metric} not supported')
 
 
+def _compute_volume_unit_ball(d: int, metric: str = NEIGHBORS_METRIC) -> float:
+    """Compute volume of a d-dimensional unit ball in R^d with given metric"""
+    return np.exp(_compute_log_volume_unit_ball(d, metric=metric))
+
+
 def _is_column_disc(col: np.ndarray) -> bool:
     # Heuristics to decide if column is discrete
 
@@ -148,26 +159,6 @@ def _compute_epsilon(x: np.ndarray) -> np.ndarray:
     return asarray2d(2. * distances)
 
 
-def _compute_n_points_within_radius_i(
-    nn: NearestNeighbors,
-    x_i: np.ndarray,
-    radius_i: np.ndarray,
-) -> int:
-    if x_i.shape[0] != 1 or radius_i.shape[0] != 1:
-        raise ValueError
-
-    # adjustment as radius_neighbors would find exact matches
-    radius_i = np.nextafter(radius_i, 0)
-
-    ind = nn.radius_neighbors(X=x_i, radius=radius_i, return_distance=False)
-    return ind[0].size
-
-
-def _ithrow(x: np.ndarray, i: int) -> np.ndarray:
-    # seem to need to index as x[i:i+1, :] to get a (1,m) row array.
-    return x[i:i + 1, :]
-
-
 def _compute_n_points_within_radius(
     x: np.ndarray, radius: np.ndarray
 ) -> np.ndarray:
@@ -180,18 +171,15 @@ def _compute_n_points_within_radius(
         radius: radius from each point of shape (n_instances, 1)
     """
     check_consistent_length(x, radius)
-    n = x.shape[0]
 
-    nn = _make_neighbors()
-    nn.fit(x)
+    # query all points at once with a per-point radius, rather than issuing
+    # one radius_neighbors query per row
+    tree = KDTree(x, metric=NEIGHBORS_METRIC)
 
-    # this will be slow
-    nx = np.array([
-        _compute_n_points_within_radius_i(nn, _ithrow(x, i), radius[i])
-        for i in range(n)
-    ])
+    # adjustment as query_radius would find exact matches
+    radius = np.nextafter(np.ravel(radius), 0)
 
-    return nx
+    return tree.query_radius(x, radius, count_only=True)
 
 
 # Entropy estimation
@@ -265,8 +253,8 @@ def _estimate_cont_entropy(x: np.ndarray, epsilon: np.ndarray) -> float:
     x = asarray2d(x)
     n, d = x.shape
     nx = _compute_n_points_within_radius(x, epsilon / 2.0)
-    c_d = _compute_volume_unit_ball(d)
-    return -np.mean(digamma(nx + 1)) + digamma(n) + np.log(c_d) \
+    log_c_d = _compute_log_volume_unit_ball(d)
+    return -np.mean(digamma(nx + 1)) + digamma(n) + log_c_d \
         + d * np.mean(np.log(epsilon))
 
 
@@ -8,7 +8,8 @@ from ballet.util.log import logger
 from ballet.util.testing import seeded
 from ballet.validation.base import FeatureAcceptanceMixin, FeatureAccepter
 from ballet.validation.common import (
-    RandomFeaturePerformanceEvaluator, load_spec,)
+    RandomFeaturePerformanceEvaluator, load_spec, share_result,
+    shared_results,)
 from ballet.validation.entropy import (
     estimate_conditional_information, estimate_mutual_information,)
 from ballet.validation.gfssf import (
@@ -16,8 +17,20 @@ from ballet.validation.gfssf import (
     _compute_threshold, _concat_datasets,)
 
 
+@share_result
+def _transform_candidate(feature, X_df, y_df, X_df_val):
+    return (
+        feature
+        .as_feature_engineering_pipeline()
+        .fit(X_df, y=y_df)
+        .transform(X_df_val)
+    )
+
+
 class NeverAccepter(FeatureAccepter):
 
+    __slots__ = ()
+
     def judge(self):
         logger.info(f'Judging feature using {self}')
         return False
@@ -26,6 +39,8 @@ class NeverAccepter(FeatureAccepter):
 class RandomAccepter(FeatureAcceptanceMixin,
                      RandomFeaturePerformanceEvaluator):
 
+    __slots__ = ()
+
     def judge(self):
         """Accept feature with probability p"""
         logger.info(f'Judging feature using {self}')
@@ -34,6 +49,9 @@ class RandomAccepter(FeatureAcceptanceMixin,
 
 
 class AlwaysAccepter(FeatureAccepter):
+
+    __slots__ = ()
+
     def judge(self):
         logger.info(f'Judging feature using {self}')
         return True
@@ -146,12 +164,8 @@ class VarianceThresholdAccepter(FeatureAccepter):
 
     def judge(self):
         logger.info(f'Judging feature using {self}')
-        z = (
-            self.candidate_feature
-            .as_feature_engineering_pipeline()
-            .fit(self.X_df, y=self.y_df)
-            .transform(self.X_df_val)
-        )
+        z = _transform_candidate(
+            self.candidate_feature, self.X_df, self.y_df, self.X_df_val)
         var = np.var(z, axis=0)
         delta = var - self.threshold
         outcome = np.all(delta > 0)
@@ -181,12 +195,8 @@ class MutualInformationAccepter(FeatureAccepter):
 
     def judge(self):
         logger.info(f'Judging feature using {self}')
-        z = (
-            self.candidate_feature
-            .as_feature_engineering_pipeline()
-            .fit(self.X_df, y=self.y_df)
-            .transform(self.X_df_val)
-        )
+        z = _transform_candidate(
+            self.candidate_feature, self.X_df, self.y_df, self.X_df_val)
         y = self.y_val
         z, y = asarray2d(z), asarray2d(y)
         z, y = self._handle_nans(z, y)
@@ -261,10 +271,11 @@ class CompoundAccepter(FeatureAccepter):
 
     def judge(self):
         logger.info(f'Judging feature using {self}')
-        outcomes = {
-            accepter.__class__.__name__: accepter.judge()
-            for accepter in self.accepters
-        }
+        with shared_results():
+            outcomes = {
+                accepter.__class__.__name__: accepter.judge()
+                for accepter in self.accepters
+            }
         logger.debug(f'Got outcomes {outcomes!r} from underlying accepters')
         return self.agg(outcomes.values())
 
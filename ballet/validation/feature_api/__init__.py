@@ -2,10 +2,10 @@ from typing import Union
 
 import pandas as pd
 
-from ballet import logger
 from ballet.feature import Feature
+from ballet.util.log import logger
 from ballet.validation.common import (
-    check_from_class, subsample_data_for_validation,)
+    check_from_class, shared_results, subsample_data_for_validation,)
 from ballet.validation.feature_api.checks import FeatureApiCheck
 
 
@@ -15,12 +15,14 @@ def validate_feature_api(
     y_df: Union[pd.DataFrame, pd.Series],
     subsample: bool,
     log_advice: bool = False,
+    fail_fast: bool = False,
 ) -> bool:
     logger.debug(f'Validating feature {feature!r}')
     if subsample:
         X_df, y_df = subsample_data_for_validation(X_df, y_df)
-    valid, failures, advice = check_from_class(
-        FeatureApiCheck, feature, X_df, y_df)
+    with shared_results():
+        valid, failures, advice = check_from_class(
+            FeatureApiCheck, feature, X_df, y_df, fail_fast=fail_fast)
     if valid:
         logger.info('Feature is valid')
     else:
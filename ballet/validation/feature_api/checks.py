@@ -3,12 +3,13 @@ from copy import deepcopy
 
 import dill as pickle
 import numpy as np
-from funcy import all, all_fn, isa, iterable
+from funcy import iterable
 from sklearn.model_selection import train_test_split
 
 from ballet.feature import Feature
 from ballet.util import RANDOM_STATE
 from ballet.validation.base import BaseCheck
+from ballet.validation.common import share_result
 
 
 def _get_one_row(*args):
@@ -18,6 +19,12 @@ def _get_one_row(*args):
     )
 
 
+@share_result
+def _fit_transform(feature, X, y):
+    mapper = feature.as_feature_engineering_pipeline()
+    return mapper.fit_transform(X, y=y)
+
+
 class FeatureApiCheck(BaseCheck):
     """Base class for implementing new Feature API checks
 
@@ -46,10 +53,8 @@ class HasCorrectInputTypeCheck(FeatureApiCheck):
     def check(self, feature):
         """Check that the feature's `input` is a str or Iterable[str]"""
         input = feature.input
-        is_str = isa(str)
-        is_nested_str = all_fn(
-            iterable, lambda x: all(is_str, x))
-        assert is_str(input) or is_nested_str(input)
+        assert isinstance(input, str) or (
+            iterable(input) and all(isinstance(x, str) for x in input))
 
     def give_advice(self, feature):
         return f'The feature\'s input needs to be a string or list of strings, whereas it is actually of type {type(feature.input).__name__}'  # noqa
@@ -149,8 +154,7 @@ class CanFitTransformCheck(FeatureApiCheck):
 
     def check(self, feature):
         """Check that fit_transform can be called on reference data"""
-        mapper = feature.as_feature_engineering_pipeline()
-        mapper.fit_transform(self.X, y=self.y)
+        _fit_transform(feature, self.X, self.y)
 
     def give_advice(self, feature):
         return 'The feature fails when calling fit_transform on sample data'
@@ -164,13 +168,11 @@ class HasCorrectOutputDimensionsCheck(FeatureApiCheck):
         For input X, an n x p array, a n x q array should be produced,
         where q is the number of feature values produced by the feature.
         """
-        mapper = feature.as_feature_engineering_pipeline()
-        X = mapper.fit_transform(self.X, y=self.y)
+        X = _fit_transform(feature, self.X, self.y)
         assert self.X.shape[0] == X.shape[0]
 
     def give_advice(self, feature):
-        mapper = feature.as_feature_engineering_pipeline()
-        X = mapper.fit_transform(self.X, y=self.y)
+        X = _fit_transform(feature, self.X, self.y)
         n = self.X.shape[0]
         m = X.shape[0]
 
@@ -215,8 +217,7 @@ class NoMissingValuesCheck(FeatureApiCheck):
 
     def check(self, feature):
         """Check that the output of the transformer has no missing values"""
-        mapper = feature.as_feature_engineering_pipeline()
-        X = mapper.fit_transform(self.X, y=self.y)
+        X = _fit_transform(feature, self.X, self.y)
         assert not np.any(np.isnan(X))
 
     def give_advice(self, feature):
@@ -227,8 +228,7 @@ class NoInfiniteValuesCheck(FeatureApiCheck):
 
     def check(self, feature):
         """Check that the output of the transformer has no non-finite values"""
-        mapper = feature.as_feature_engineering_pipeline()
-        X = mapper.fit_transform(self.X, y=self.y)
+        X = _fit_transform(feature, self.X, self.y)
         assert not np.any(np.isinf(X))
 
     def give_advice(self, feature):
@@ -1,3 +1,9 @@
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from funcy import cached_property
+
 from ballet.contrib import _collect_contrib_features
 from ballet.project import Project
 from ballet.util.log import logger
@@ -10,12 +16,16 @@ from ballet.validation.feature_api import validate_feature_api
 class FeatureApiValidator(BaseValidator):
 
     def __init__(self, project: Project):
+        self.project = project
         self.change_collector = ChangeCollector(project)
 
-        X_df, y_df = project.api.load_data()
-        encoder = project.api.encoder
+    @cached_property
+    def _validation_data(self) -> Tuple[pd.DataFrame, np.ndarray]:
+        # loaded only once there are features to validate
+        X_df, y_df = self.project.api.load_data()
+        encoder = self.project.api.encoder
         y = encoder.fit_transform(y_df)
-        self.X_df, self.y = subsample_data_for_validation(X_df, y)
+        return subsample_data_for_validation(X_df, y)
 
     def validate(self):
         """Collect and validate all new features"""
@@ -41,7 +51,8 @@ class FeatureApiValidator(BaseValidator):
             logger.info('Failed to collect any new features.')
             return False
 
+        X_df, y = self._validation_data
         return all(
-            validate_feature_api(feature, self.X_df, self.y, False)
+            validate_feature_api(feature, X_df, y, False)
             for feature in features
         )
@@ -13,6 +13,9 @@ from ballet.validation.gfssf import (
 
 
 class NoOpPruner(FeaturePruner):
+
+    __slots__ = ()
+
     def prune(self):
         logger.info(f'Pruning features using {self}')
         return []
@@ -20,6 +23,8 @@ class NoOpPruner(FeaturePruner):
 
 class RandomPruner(FeaturePruningMixin, RandomFeaturePerformanceEvaluator):
 
+    __slots__ = ()
+
     def prune(self):
         """With probability p, select a random feature to prune"""
         logger.info(f'Pruning features using {self}')
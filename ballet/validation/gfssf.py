@@ -21,8 +21,9 @@ def _concat_datasets(
     if omit is None:
         omit = []
 
+    # np.asarray avoids copying each block before concatenate copies it again
     filtered_dfs = [
-        np.array(feature_df_map[feature])
+        np.asarray(feature_df_map[feature])
         for feature in feature_df_map
         if feature not in omit
     ]
@@ -122,6 +123,7 @@ class GFSSFPerformanceEvaluator(FeaturePerformanceEvaluator):
             lmbda_2 = estimate_entropy(self.y_val) / lambda_2_adjustment
         self.lmbda_1 = lmbda_1
         self.lmbda_2 = lmbda_2
+        self._feature_df_map: Optional[Dict[Feature, np.ndarray]] = None
 
     def __str__(self):
         cls = super().__str__()
@@ -129,6 +131,14 @@ class GFSSFPerformanceEvaluator(FeaturePerformanceEvaluator):
             f'{cls}: lmbda_1={self.lmbda_1:0.4f}, lmbda_2={self.lmbda_2:0.4f}'
 
     def _get_feature_df_map(self):
+        # the features and data do not change over the life of the evaluator,
+        # so transform them once and hand out shallow copies that callers
+        # are free to mutate (e.g. the pruner deletes redundant features)
+        if self._feature_df_map is None:
+            self._feature_df_map = self._compute_feature_df_map()
+        return dict(self._feature_df_map)
+
+    def _compute_feature_df_map(self):
         all_features = [*self.features, self.candidate_feature]
 
         def as_features(feature):
@@ -1,5 +1,5 @@
 import inspect
-from typing import Callable, List, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 import pandas as pd
 from funcy import decorator, func_partial, ignore
@@ -69,13 +69,17 @@ def _load_validator_class_params(
 
 
 def _load_validation_data(
-    project: Project
+    project: Project,
+    X_df: Optional[pd.DataFrame] = None,
+    y_df: Optional[Union[pd.DataFrame, pd.Series]] = None,
 ) -> Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series]]:
     """Load the validation data split
 
     The validation data split should be given by the key `validation.split` in
     the project's config. If the key is not present, or the `load_data` method
     does not support loading splits, then the default dataset is returned.
+    If the caller has already loaded the default dataset, it can pass it as
+    ``X_df`` and ``y_df`` to have it returned rather than loaded again.
     """
     kwargs = {}
     try:
@@ -85,6 +89,8 @@ def _load_validation_data(
             kwargs['split'] = val_split
     except Exception:
         pass
+    if not kwargs and X_df is not None and y_df is not None:
+        return X_df, y_df
     X_df, y_df = project.api.load_data(**kwargs)
     return X_df, y_df
 
@@ -123,7 +129,7 @@ def _evaluate_feature_performance(project: Project, force: bool = False):
         raise SkippedValidationTest('Not on feature branch')
 
     X_df, y_df = project.api.load_data()
-    X_df_val, y_df_val = _load_validation_data(project)
+    X_df_val, y_df_val = _load_validation_data(project, X_df, y_df)
 
     encoder = project.api.encoder
     y_val = encoder.fit(y_df).transform(y_df_val)
@@ -158,7 +164,7 @@ def _prune_existing_features(
         raise SkippedValidationTest('No features collected')
 
     X_df, y_df = project.api.load_data()
-    X_df_val, y_df_val = _load_validation_data(project)
+    X_df_val, y_df_val = _load_validation_data(project, X_df, y_df)
 
     encoder = project.api.encoder
     y_val = encoder.fit(y_df).transform(y_df_val)
@@ -1,5 +1,6 @@
 import importlib.machinery
 import pathlib
+from functools import lru_cache
 
 from funcy import re_test
 
@@ -9,6 +10,15 @@ from ballet.validation.base import BaseCheck
 
 FEATURE_MODULE_NAME_REGEX = r'feature_(?P<featurename>[a-zA-Z0-9_]+)\.py'
 SUBPACKAGE_NAME_REGEX = r'user_(?P<username>[a-zA-Z0-9_]+)'
+SOURCE_SUFFIXES = tuple(importlib.machinery.SOURCE_SUFFIXES)
+
+
+@lru_cache(maxsize=16)
+def _dir_prefix(dir: str) -> str:
+    # git reports paths relative to the repo root with forward slashes, so a
+    # file is within dir if its path starts with the normalized dir and '/'
+    normalized = str(pathlib.PurePosixPath(dir))
+    return '' if normalized == '.' else normalized + '/'
 
 
 class ProjectStructureCheck(BaseCheck):
@@ -33,11 +43,7 @@ class IsPythonSourceCheck(ProjectStructureCheck):
 
     def check(self, diff):
         """Check that the new file introduced is a python source file"""
-        path = diff.b_path
-        assert any(
-            path.endswith(ext)
-            for ext in importlib.machinery.SOURCE_SUFFIXES
-        )
+        assert diff.b_path.endswith(SOURCE_SUFFIXES)
 
 
 class WithinContribCheck(ProjectStructureCheck):
@@ -46,7 +52,7 @@ class WithinContribCheck(ProjectStructureCheck):
         """Check that the new file is within the contrib subdirectory"""
         path = diff.b_path
         contrib_path = self.project.config.get('contrib.module_path')
-        assert pathlib.Path(contrib_path) in pathlib.Path(path).parents
+        assert path.startswith(_dir_prefix(contrib_path))
 
 
 class SubpackageNameCheck(ProjectStructureCheck):
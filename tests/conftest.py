@@ -11,6 +11,7 @@ import pytest
 import responses as _responses
 
 import ballet
+from ballet.feature import Feature
 from ballet.project import Project
 from ballet.templating import render_project_template
 from ballet.util import work_in
@@ -121,3 +122,17 @@ def sample_data():
     X = df[['size', 'strength']]
     y = df[['happy']]
     return SampleData(df, X, y)
+
+
+@pytest.fixture
+def mock_feature_pipeline():
+    """Spy on Feature.as_feature_engineering_pipeline
+
+    Pipelines are still built by the real method, but calls are recorded.
+    """
+    make_pipeline = Feature.as_feature_engineering_pipeline
+    with patch.object(
+        Feature, 'as_feature_engineering_pipeline', autospec=True,
+        side_effect=make_pipeline,
+    ) as mock_make_pipeline:
+        yield mock_make_pipeline
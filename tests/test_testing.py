@@ -1,12 +1,18 @@
+import random
+from unittest.mock import Mock
+
 import numpy as np
 import pandas as pd
 import pandas.util.testing as pdt
 import pytest
 
 from ballet.util.testing import (
-    assert_array_equal, assert_array_not_equal, assert_frame_equal,
-    assert_frame_not_equal, assert_index_equal, assert_index_not_equal,
-    assert_series_equal, assert_series_not_equal,)
+    assert_array_equal, assert_array_not_almost_equal, assert_array_not_equal,
+    assert_frame_equal, assert_frame_not_equal, assert_index_equal,
+    assert_index_not_equal, assert_pandas_object_equal,
+    assert_pandas_object_not_equal, assert_series_equal,
+    assert_series_not_equal, log_seed_on_error, seeded, seeded_numpy,
+    seeded_random,)
 
 
 def test_assert_array_equal():
@@ -64,6 +70,8 @@ def test_assert_frame_not_equal():
     b = a.copy()
     with pytest.raises(AssertionError):
         assert_frame_not_equal(a, b)
+    with pytest.raises(AssertionError):
+        assert_frame_not_equal(a, a)
 
     c = a + 1
     assert_frame_not_equal(a, c)
@@ -145,3 +153,146 @@ def test_assert_index_not_equal():
 
     e = pdt.makeDataFrame()
     assert_index_not_equal(a, e)
+
+
+def test_assert_pandas_object_equal():
+    a = pd.Series(np.arange(21))
+    assert_pandas_object_equal(a, a.copy())
+    with pytest.raises(AssertionError):
+        assert_pandas_object_equal(a, a + 1)
+
+    # subclasses dispatch to the assertion for their base class
+    b = pd.RangeIndex(21)
+    assert_pandas_object_equal(b, pd.RangeIndex(21))
+    with pytest.raises(AssertionError):
+        assert_pandas_object_equal(b, pd.RangeIndex(17))
+
+    with pytest.raises(AssertionError):
+        assert_pandas_object_equal(a, np.arange(21))
+
+    c = pd.Categorical(['a', 'b'])
+    with pytest.raises(AssertionError):
+        assert_pandas_object_equal(c, c.copy())
+
+
+def test_assert_pandas_object_not_equal():
+    a = pdt.makeDataFrame()
+    assert_pandas_object_not_equal(a, a + 1)
+    with pytest.raises(AssertionError):
+        assert_pandas_object_not_equal(a, a.copy())
+
+    b = pd.RangeIndex(21)
+    assert_pandas_object_not_equal(b, pd.RangeIndex(17))
+    with pytest.raises(AssertionError):
+        assert_pandas_object_not_equal(b, pd.RangeIndex(21))
+
+    assert_pandas_object_not_equal(a, np.arange(21))
+
+
+@pytest.mark.parametrize('c', [
+    pd.Categorical(['a', 'b']),
+    pd.array([1, 2], dtype='Int64'),
+])
+def test_assert_pandas_object_not_equal_unsupported_type(c):
+    with pytest.raises(TypeError):
+        assert_pandas_object_not_equal(c, c.copy())
+    with pytest.raises(TypeError):
+        assert_pandas_object_not_equal(pd.Series(c), c)
+
+
+def test_seeded():
+    with seeded(1):
+        a = np.random.rand(), random.random()
+    with seeded(1):
+        b = np.random.rand(), random.random()
+    assert a == b
+
+    # state is restored after the block, even if it raises
+    np_state = np.random.get_state()
+    state = random.getstate()
+    with pytest.raises(ValueError):
+        with seeded(2):
+            np.random.rand()
+            random.random()
+            raise ValueError
+    assert_array_equal(np.random.get_state()[1], np_state[1])
+    assert random.getstate() == state
+
+    with seeded(None):
+        pass
+
+
+def test_assert_array_not_equal_nan():
+    a = np.array([1.0, np.nan, 3.0])
+    with pytest.raises(AssertionError):
+        assert_array_not_equal(a, a.copy())
+    assert_array_not_equal(a, np.array([1.0, 2.0, 3.0]))
+
+    # mixed shapes and dtypes go through numpy.testing
+    with pytest.raises(AssertionError):
+        assert_array_not_equal(np.zeros(3), 0)
+    assert_array_not_equal(np.array(['a', 'b']), np.array(['a', 'c']))
+
+
+def test_assert_array_not_almost_equal():
+    a = np.array([1.0, np.nan, np.inf])
+    with pytest.raises(AssertionError):
+        assert_array_not_almost_equal(a, a + 1e-8)
+    assert_array_not_almost_equal(a, a + 1e-3)
+    assert_array_not_almost_equal(a, -a)
+
+    with pytest.raises(AssertionError):
+        assert_array_not_almost_equal(a, a + 1e-3, delta=1e-2)
+    assert_array_not_almost_equal(a, a + 1e-1, delta=1e-2)
+
+
+def test_assert_array_equal_nan():
+    a = np.array([1.0, np.nan, 3.0])
+    assert_array_equal(a, a)
+    assert_array_equal(a, a.copy())
+    with pytest.raises(AssertionError):
+        assert_array_equal(a, np.array([1.0, 2.0, 3.0]))
+
+
+def test_assert_pandas_object_equal_large_message():
+    a = pd.DataFrame(np.zeros((20_000, 2)))
+    match = r'<DataFrame shape=\(20000, 2\)>'
+    with pytest.raises(AssertionError, match=match):
+        assert_pandas_object_equal(a, np.zeros(3))
+
+
+def test_assert_pandas_object_equal_size_method():
+    # GroupBy.size is a method, not the number of elements
+    a = pd.DataFrame({'a': [1, 2]}).groupby('a')
+    with pytest.raises(AssertionError, match='uncomparable types'):
+        assert_pandas_object_equal(a, np.zeros(3))
+
+
+def test_log_seed_on_error():
+    logger = Mock()
+    state = random.getstate()
+    with log_seed_on_error(logger):
+        pass
+    assert random.getstate() == state
+    logger.exception.assert_not_called()
+
+    with log_seed_on_error(logger, seed=3):
+        raise ValueError
+    logger.exception.assert_called_once_with(
+        'Error was thrown using seed 3')
+
+
+def test_seeded_numpy_and_random():
+    state = random.getstate()
+    with seeded_numpy(1):
+        a = np.random.rand()
+    assert random.getstate() == state
+    with seeded(1):
+        assert np.random.rand() == a
+
+    np_state = np.random.get_state()
+    with seeded_random(1):
+        b = random.random()
+    assert_array_equal(np.random.get_state()[1], np_state[1])
+    with seeded(1):
+        assert random.random() == b
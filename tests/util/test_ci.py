@@ -3,7 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from ballet.util.ci import (
-    TravisPullRequestBuildDiffer, get_travis_branch, is_travis_pr,)
+    TravisPullRequestBuildDiffer, get_travis_branch, in_travis, is_travis_pr,)
 from ballet.util.git import make_commit_range
 from tests.util import make_mock_commit, make_mock_commits
 
@@ -13,6 +13,20 @@ def commit_range():
     return 'HEAD^..HEAD'
 
 
+@pytest.mark.parametrize(
+    ('env, expected'),
+    [
+        ({'TRAVIS': 'true', 'CI': 'true'}, True),
+        ({'TRAVIS_BUILD_DIR': '/tmp'}, True),
+        ({'CI': 'true'}, False),
+        ({}, False),
+    ],
+)
+def test_in_travis(env, expected):
+    with patch.dict('os.environ', env, clear=True):
+        assert in_travis() == expected
+
+
 @pytest.mark.parametrize(
     ('key, value, expected'),
     [
@@ -119,3 +133,22 @@ def test_travis_pull_request_build_differ_on_mock_commits(mock_repo):
             assert diff.change_type == 'A'
             assert diff.b_path == f'file{j}.py'
             j += 1
+
+
+def test_travis_pull_request_build_differ_detects_repo(mock_repo):
+    repo = mock_repo
+    make_mock_commits(repo, n=2)
+
+    travis_env_vars = {
+        'TRAVIS_BUILD_DIR': repo.working_tree_dir,
+        'TRAVIS_PULL_REQUEST': '1',
+        'TRAVIS_COMMIT_RANGE': 'HEAD^..HEAD',
+    }
+    with patch.dict('os.environ', travis_env_vars, clear=True):
+        differ = TravisPullRequestBuildDiffer()
+    assert differ.repo.working_tree_dir == repo.working_tree_dir
+
+    # env vars were read when the differ was created
+    a, b = differ._get_diff_endpoints()
+    assert a == repo.rev_parse('HEAD^')
+    assert b == repo.rev_parse('HEAD')
@@ -1,12 +1,18 @@
+import pathlib
+import shutil
+from collections import Counter
 from unittest.mock import create_autospec, patch
 
 import git
 import pytest
 from github import Github
 
+from ballet.util import work_in
 from ballet.util.git import (
-    create_github_repo, did_git_push_succeed, get_pull_request_outcomes,
-    get_pull_requests, make_commit_range, push_branches_to_remote,)
+    _pull_requests_cache, count_pull_request_outcomes, create_github_repo,
+    did_git_push_succeed, get_pull_request_outcomes, get_pull_requests,
+    get_repo, is_merge_commit, iter_pull_requests, make_commit_range,
+    push_branches_to_remote,)
 
 
 def test_make_commit_range():
@@ -27,11 +33,37 @@ def test_get_repo():
     raise NotImplementedError
 
 
+def test_get_repo_from_cwd(tmp_path):
+    git.Repo.init(str(tmp_path))
+    with work_in(tmp_path):
+        repo = get_repo()
+        assert pathlib.Path(repo.working_tree_dir) == tmp_path
+
+        # the repo is detected afresh, not returned from a stale cache
+        shutil.rmtree(tmp_path / '.git')
+        with pytest.raises(git.InvalidGitRepositoryError):
+            get_repo()
+
+
 @pytest.mark.xfail
 def test_get_branch():
     raise NotImplementedError
 
 
+def test_is_merge_commit(tmp_path):
+    repo = git.Repo.init(str(tmp_path))
+    commit = repo.index.commit('initial commit')
+    assert not is_merge_commit(commit)
+
+    other = repo.index.commit('other commit', parent_commits=[commit])
+    merge = repo.index.commit(
+        'merge commit', parent_commits=[commit, other])
+    assert is_merge_commit(merge)
+
+    # another object for the same commit
+    assert is_merge_commit(repo.commit(merge.hexsha))
+
+
 @pytest.mark.xfail
 def test_switch_to_new_branch():
     raise NotImplementedError
@@ -42,7 +74,8 @@ def test_set_config_variables():
     raise NotImplementedError
 
 
-@patch('requests.get')
+@patch.dict('ballet.util.git._pull_requests_cache', clear=True)
+@patch('requests.Session.get')
 def test_get_pull_requests(mock_requests_get):
     owner = 'foo'
     repo = 'bar'
@@ -57,9 +90,9 @@ def test_get_pull_requests(mock_requests_get):
     assert kwargs['params']['state'] == state
 
 
-@patch('ballet.util.git.get_pull_requests')
-def test_get_pull_request_outcomes(mock_get_pull_requests):
-    mock_get_pull_requests.return_value = [
+@patch('ballet.util.git.iter_pull_requests')
+def test_get_pull_request_outcomes(mock_iter_pull_requests):
+    mock_iter_pull_requests.return_value = [
         {
             'id': 1,
             "created_at": "2011-01-26T19:01:12Z",
@@ -78,11 +111,81 @@ def test_get_pull_request_outcomes(mock_get_pull_requests):
     repo = 'bar'
 
     expected = ['accepted', 'rejected']
-    actual = get_pull_request_outcomes(owner, repo)
+    actual = list(get_pull_request_outcomes(owner, repo))
     assert actual == expected
-    mock_get_pull_requests.assert_called_once_with(
+    mock_iter_pull_requests.assert_called_once_with(
         owner, repo, state='closed')
 
+    mock_iter_pull_requests.reset_mock()
+    expected = Counter(accepted=1, rejected=1)
+    actual = count_pull_request_outcomes(owner, repo)
+    assert actual == expected
+
+
+@patch.dict('ballet.util.git._pull_requests_cache', clear=True)
+def test_iter_pull_requests(responses):
+    owner = 'foo'
+    repo = 'bar'
+    url = f'https://api.github.com/repos/{owner}/{repo}/pulls'
+    responses.add(
+        responses.GET, url, json=[{'id': 1}, {'id': 2}],
+        headers={'Link': f'<{url}?page=2>; rel="next"'})
+    responses.add(responses.GET, url, json=[{'id': 3}])
+
+    actual = [pr['id'] for pr in iter_pull_requests(owner, repo)]
+    assert actual == [1, 2, 3]
+    assert len(responses.calls) == 2
+
+
+@patch.dict('ballet.util.git._pull_requests_cache', clear=True)
+def test_get_pull_requests_not_modified(responses):
+    owner = 'foo'
+    repo = 'bar'
+    url = f'https://api.github.com/repos/{owner}/{repo}/pulls'
+    etag = '"abc123"'
+    responses.add(responses.GET, url, json=[{'id': 1}],
+                  headers={'ETag': etag})
+    responses.add(responses.GET, url, status=304)
+
+    expected = [{'id': 1}]
+    assert get_pull_requests(owner, repo) == expected
+    assert get_pull_requests(owner, repo) == expected
+    assert len(responses.calls) == 2
+    assert 'If-None-Match' not in responses.calls[0].request.headers
+    assert responses.calls[1].request.headers['If-None-Match'] == etag
+
+
+@patch.dict('ballet.util.git._pull_requests_cache', clear=True)
+def test_get_pull_requests_cached_page_is_copied(responses):
+    owner = 'foo'
+    repo = 'bar'
+    url = f'https://api.github.com/repos/{owner}/{repo}/pulls'
+    responses.add(responses.GET, url, json=[{'id': 1}],
+                  headers={'ETag': '"abc123"'})
+    responses.add(responses.GET, url, status=304)
+    responses.add(responses.GET, url, status=304)
+
+    # modifying a returned page does not modify the cached page
+    get_pull_requests(owner, repo).append({'id': 2})
+    get_pull_requests(owner, repo).append({'id': 3})
+    assert get_pull_requests(owner, repo) == [{'id': 1}]
+
+
+@patch('ballet.util.git._PULL_REQUESTS_CACHE_MAXSIZE', 2)
+@patch.dict('ballet.util.git._pull_requests_cache', clear=True)
+def test_get_pull_requests_cache_is_bounded(responses):
+    owner = 'foo'
+    url = 'https://api.github.com/repos/{owner}/{repo}/pulls'
+    repos = ['bar', 'baz', 'qux']
+    for repo in repos:
+        responses.add(responses.GET, url.format(owner=owner, repo=repo),
+                      json=[], headers={'ETag': f'"{repo}"'})
+        get_pull_requests(owner, repo)
+
+    # the least recently used page was evicted
+    cached_repos = [repo for _, repo, _, _ in _pull_requests_cache]
+    assert cached_repos == ['baz', 'qux']
+
 
 def test_did_git_push_succeed():
     local_ref = None
@@ -1,4 +1,5 @@
 import os
+import pickle
 from unittest.mock import ANY, mock_open, patch
 
 import numpy as np
@@ -6,7 +7,8 @@ import pandas as pd
 import pytest
 
 from ballet.util.io import (
-    _check_ext, _write_tabular_h5, _write_tabular_pickle, write_tabular,)
+    PANDAS_HDF_COMPRESSION_KWARGS, _read_tabular_pickle, _write_tabular_h5,
+    _write_tabular_pickle, read_tabular, write_tabular,)
 
 
 @pytest.fixture
@@ -19,19 +21,6 @@ def frame():
     return pd.util.testing.makeDataFrame()
 
 
-def test_check_ext_valid():
-    ext = '.py'
-    expected = ext
-    _check_ext(ext, expected)
-
-
-def test_check_ext_invalid_throws():
-    ext = '.py'
-    expected = '.txt'
-    with pytest.raises(ValueError):
-        _check_ext(ext, expected)
-
-
 @patch('ballet.util.io._write_tabular_pickle')
 @patch('ballet.util.io._write_tabular_h5')
 def test_write_tabular(mock_write_tabular_h5,
@@ -39,7 +28,7 @@ def test_write_tabular(mock_write_tabular_h5,
     obj = object()
     filepath = '/foo/bar/baz.h5'
     write_tabular(obj, filepath)
-    mock_write_tabular_h5.assert_called_once_with(obj, filepath)
+    mock_write_tabular_h5.assert_called_once_with(obj, filepath, 'baz')
 
     obj = object()
     filepath = '/foo/bar/baz.pkl'
@@ -52,13 +41,18 @@ def test_write_tabular(mock_write_tabular_h5,
         write_tabular(obj, filepath)
 
 
-@patch('builtins.open', new_callable=mock_open)
-@patch('pickle.dump')
-def test_write_tabular_pickle_ndarray(mock_dump, mock_open, array):
+def test_write_tabular_pickle_ndarray(tmp_path, array):
     obj = array
-    filepath = '/foo/bar/baz.pkl'
+    filepath = tmp_path.joinpath('baz.pkl')
     _write_tabular_pickle(obj, filepath)
-    mock_dump.assert_called_with(obj, ANY)
+
+    # the file is a plain pickle, written with protocol 4
+    with open(filepath, 'rb') as f:
+        assert f.read(2) == b'\x80\x04'
+        f.seek(0)
+        result = pickle.load(f)
+    np.testing.assert_array_equal(result, obj)
+    np.testing.assert_array_equal(_read_tabular_pickle(filepath), obj)
 
 
 @patch('builtins.open', new_callable=mock_open)
@@ -82,20 +76,24 @@ def test_write_tabular_pickle_nonarray_raises():
 def test_write_tabular_h5_ndarray(tmp_path, array):
     obj = array
     filepath = tmp_path.joinpath('baz.h5')
-    _write_tabular_h5(obj, filepath)
+    _write_tabular_h5(obj, filepath, 'baz')
 
     file_size = os.path.getsize(filepath)
     assert file_size > 0
 
+    result = read_tabular(filepath)
+    np.testing.assert_array_equal(result, obj)
+
 
 def test_write_tabular_h5_ndframe(frame):
     obj = frame
     filepath = '/foo/bar/baz.h5'
 
     with patch.object(obj, 'to_hdf') as mock_to_hdf:
-        _write_tabular_h5(obj, filepath)
+        _write_tabular_h5(obj, filepath, 'baz')
 
-    mock_to_hdf.assert_called_with(filepath, key=ANY)
+    mock_to_hdf.assert_called_with(
+        filepath, key=ANY, **PANDAS_HDF_COMPRESSION_KWARGS)
 
 
 @pytest.mark.xfail
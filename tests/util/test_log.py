@@ -1,9 +1,13 @@
 import logging
+import logging.handlers
 import random
+from unittest.mock import Mock, patch
 
 import pytest
 
-from ballet.util.log import LevelFilter, LoggingContext, enable
+import ballet.util.log
+from ballet.util.log import (
+    LevelFilter, LoggingContext, enable, stacklog_if_enabled,)
 
 
 @pytest.fixture
@@ -12,13 +16,57 @@ def logger():
     return logging.getLogger(name)
 
 
-@pytest.mark.parametrize('level', [logging.INFO, 'CRITICAL'])
+@pytest.fixture
+def stop_queue_listener():
+    yield
+    ballet.util.log._stop_queue_listener()
+
+
+@pytest.mark.parametrize('level', [logging.INFO, 'CRITICAL', 15])
 def test_enable(logger, caplog, level):
     with caplog.at_level(level, logger=logger.name):
         enable(logger, level, echo=True)
     assert 'enabled' in caplog.text
 
 
+def test_enable_buffered(logger):
+    enable(logger, level='INFO', echo=False, buffered=True, capacity=10)
+    handlers = [
+        handler
+        for handler in logger.handlers
+        if isinstance(handler, logging.handlers.MemoryHandler)
+    ]
+    assert len(handlers) == 1
+    assert handlers[0].capacity == 10
+    assert isinstance(handlers[0].target, logging.StreamHandler)
+
+    # switching back removes the buffered handler
+    enable(logger, level='INFO', echo=False)
+    assert handlers[0] not in logger.handlers
+    assert handlers[0].target in logger.handlers
+
+
+def test_enable_async(logger, stop_queue_listener):
+    enable(logger, level='INFO', echo=False, async_=True)
+    handlers = [
+        handler
+        for handler in logger.handlers
+        if isinstance(handler, logging.handlers.QueueHandler)
+    ]
+    assert len(handlers) == 1
+    assert ballet.util.log._queue_listener is not None
+
+    # switching back removes the queue handler and stops its listener
+    enable(logger, level='INFO', echo=False)
+    assert handlers[0] not in logger.handlers
+    assert ballet.util.log._queue_listener is None
+
+
+def test_enable_buffered_and_async_raises(logger):
+    with pytest.raises(ValueError):
+        enable(logger, buffered=True, async_=True)
+
+
 def test_level_filter_matches(logger, caplog):
     enable(logger, level='DEBUG', echo=False)
     logger.addFilter(LevelFilter(logging.CRITICAL))
@@ -48,3 +96,42 @@ def test_logging_context(logger, caplog):
         with LoggingContext(logger, level='INFO'):
             logger.debug('msg')
     assert not caplog.text
+
+
+def test_logging_context_handler(logger):
+    handler = logging.NullHandler()
+    with patch.object(handler, 'close') as mock_close:
+        with LoggingContext(logger, handler=handler):
+            assert handler in logger.handlers
+        assert handler not in logger.handlers
+        mock_close.assert_called_once_with()
+    assert not hasattr(LoggingContext(logger), '__dict__')
+
+
+def test_stacklog_if_enabled(logger, caplog):
+    enable(logger, level='INFO', echo=False)
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with stacklog_if_enabled(logger.debug, 'hidden'):
+            pass
+        with stacklog_if_enabled(logger.info, 'shown'):
+            pass
+    assert 'hidden' not in caplog.text
+    assert 'shown...DONE' in caplog.text
+
+
+def test_stacklog_if_enabled_checks_when_called(logger, caplog):
+    enable(logger, level='INFO', echo=False)
+    ctx = stacklog_if_enabled(logger.debug, 'msg')
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        with ctx:
+            pass
+        with stacklog_if_enabled(logger.debug, 'msg'):
+            pass
+    assert caplog.text.count('msg...DONE') == 1
+
+
+def test_stacklog_if_enabled_other_method():
+    method = Mock()
+    with stacklog_if_enabled(method, 'msg'):
+        pass
+    method.assert_called_with('msg...DONE')
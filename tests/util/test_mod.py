@@ -1,5 +1,7 @@
 import pathlib
 import types
+from collections import OrderedDict
+from unittest.mock import patch
 
 import pytest
 
@@ -57,6 +59,109 @@ def test_import_module_at_path_bad_package_structure():
     raise NotImplementedError
 
 
+def test_import_module_at_path_init_added_later(tmp_path):
+    path = tmp_path.joinpath('qux', 'bar.py')
+    path.parent.mkdir(parents=True)
+    path.touch()
+    modname = 'qux.bar'
+    modpath = str(path)
+    with pytest.raises(ImportError):
+        import_module_at_path(modname, modpath)
+
+    # package structure is re-checked after __init__.py is created
+    path.parent.joinpath('__init__.py').touch()
+    mod = import_module_at_path(modname, modpath)
+    assert mod.__name__ == modname
+
+
+def test_import_module_at_path_reuses_unchanged_module(tmp_path):
+    path = tmp_path.joinpath('quux', 'bar.py')
+    path.parent.mkdir(parents=True)
+    path.parent.joinpath('__init__.py').touch()
+    path.write_text('x = object()')
+    modname = 'quux.bar'
+    modpath = str(path)
+
+    mod1 = import_module_at_path(modname, modpath)
+    mod2 = import_module_at_path(modname, modpath)
+    assert mod1 is mod2
+    x = mod1.x
+    assert mod2.x is x
+
+    # the module is executed again once its source changes
+    path.write_text('x = "changed"')
+    mod3 = import_module_at_path(modname, modpath)
+    assert mod3.x == 'changed'
+
+
+def test_import_module_at_path_checks_structure_of_cached_module(tmp_path):
+    path = tmp_path.joinpath('grault', 'bar.py')
+    path.parent.mkdir(parents=True)
+    init = path.parent.joinpath('__init__.py')
+    init.touch()
+    path.write_text('x = 1')
+    modname = 'grault.bar'
+    modpath = str(path)
+
+    import_module_at_path(modname, modpath)
+
+    init.unlink()
+    with pytest.raises(ImportError):
+        import_module_at_path(modname, modpath)
+
+
+def test_import_module_at_path_without_cache(tmp_path):
+    path = tmp_path.joinpath('garply', 'bar.py')
+    path.parent.mkdir(parents=True)
+    path.parent.joinpath('__init__.py').touch()
+    path.write_text('x = object()')
+    modname = 'garply.bar'
+    modpath = str(path)
+
+    mod1 = import_module_at_path(modname, modpath)
+    x = mod1.x
+    mod2 = import_module_at_path(modname, modpath, use_cache=False)
+    assert mod2.x is not x
+
+
+def test_import_module_at_path_same_name_different_paths(tmp_path):
+    modname = 'corge.bar'
+    modpaths = {}
+    for name in ('A', 'B'):
+        path = tmp_path.joinpath(name, 'corge', 'bar.py')
+        path.parent.mkdir(parents=True)
+        path.parent.joinpath('__init__.py').touch()
+        path.write_text(f'x = {name!r}')
+        modpaths[name] = str(path)
+
+    assert import_module_at_path(modname, modpaths['A']).x == 'A'
+    assert import_module_at_path(modname, modpaths['B']).x == 'B'
+
+    # the module object in sys.modules was re-executed from B, so the
+    # module from A must be loaded again rather than returned from the cache
+    assert import_module_at_path(modname, modpaths['A']).x == 'A'
+
+
+def test_import_module_at_path_cache_is_bounded(tmp_path):
+    pkg = tmp_path.joinpath('grault')
+    pkg.mkdir()
+    pkg.joinpath('__init__.py').touch()
+    names = ['bar', 'baz', 'qux']
+    for name in names:
+        pkg.joinpath(f'{name}.py').write_text(f'x = {name!r}')
+
+    with patch('ballet.util.mod._IMPORTED_MODULES_MAXSIZE', 2), \
+            patch('ballet.util.mod._imported_modules', OrderedDict()) \
+            as imported_modules:
+        for name in names:
+            import_module_at_path(
+                f'grault.{name}', str(pkg.joinpath(f'{name}.py')))
+
+        # the least recently used module was evicted
+        assert [modname for modname, _ in imported_modules] == \
+            ['grault.baz', 'grault.qux']
+
+
 def test_relpath_to_modname():
     relpath = 'ballet/util/_util.py'
     expected_modname = 'ballet.util._util'
@@ -39,6 +39,9 @@ def test_random_accepter(mock_uniform):
 
     assert expected == actual
 
+    # simple evaluators store their attributes in slots
+    assert not hasattr(accepter, '__dict__')
+
 
 @pytest.fixture
 def sample_data():
@@ -160,3 +163,57 @@ def test_compound_accepter(sample_data):
     actual = accepter.judge()
 
     assert expected == actual
+
+
+def test_gfssf_accepter_transforms_features_once(
+    sample_data, mock_feature_pipeline
+):
+    X_df, y_df, y = sample_data
+
+    feature_1 = Feature(
+        input='A_0',
+        transformer=IdentityTransformer(),
+        source='1st Feature')
+    feature_2 = Feature(
+        input='Z_0',
+        transformer=IdentityTransformer(),
+        source='2nd Feature')
+
+    accepter = GFSSFAccepter(
+        X_df, y_df, X_df, y, [feature_1], feature_2)
+
+    first = accepter.judge()
+    second = accepter.judge()
+
+    assert first == second
+    assert mock_feature_pipeline.call_count == 2
+
+
+def test_compound_accepter_transforms_candidate_once(
+    sample_data, mock_feature_pipeline
+):
+    X_df, y_df, y = sample_data
+    specs = [
+        {
+            'name': 'ballet.validation.feature_acceptance.validator.VarianceThresholdAccepter',  # noqa
+            'params': {
+                'threshold': 0.0,
+            }
+        },
+        {
+            'name': 'ballet.validation.feature_acceptance.validator.MutualInformationAccepter',  # noqa
+            'params': {
+                'threshold': 0.0,
+            }
+        },
+    ]
+    feature = Feature(
+        input='A_0',
+        transformer=IdentityTransformer(),
+        source='1st Feature')
+    accepter = CompoundAccepter(
+        X_df, y_df, X_df, y, [], feature, agg='all', specs=specs)
+
+    accepter.judge()
+
+    assert mock_feature_pipeline.call_count == 1
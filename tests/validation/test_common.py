@@ -1,4 +1,14 @@
-from ballet.validation.common import load_spec
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ballet.exc import BalletError
+from ballet.util.testing import assert_array_equal
+from ballet.validation.common import (
+    get_accepted_features, load_spec, share_result, shared_results,
+    subsample_data_for_validation,)
 from ballet.validation.feature_acceptance.validator import (
     AlwaysAccepter, RandomAccepter,)
 from ballet.validation.project_structure.validator import (
@@ -34,3 +44,59 @@ def test_load_spec_params():
     cls, params = load_spec(spec)
     assert cls is expected_class
     assert params['threshold'] == threshold
+
+
+def test_subsample_data_for_validation():
+    X_df = pd.DataFrame({'a': np.arange(50), 'b': np.arange(50) * 2})
+    y = np.arange(50)
+    X_df_val = pd.DataFrame({'a': np.arange(5)})
+    y_val = None
+
+    X_df_s, y_s, X_df_val_s, y_val_s = subsample_data_for_validation(
+        X_df, y, X_df_val, y_val, size=10)
+
+    # rows are subsampled in order and stay aligned
+    assert X_df_s.shape == (10, 2)
+    assert np.all(np.diff(X_df_s['a'].values) > 0)
+    assert_array_equal(X_df_s['a'].values, y_s)
+
+    # small or row-less data is returned unchanged
+    assert X_df_val_s is X_df_val
+    assert y_val_s is None
+
+    # the sample is deterministic
+    X_df_s2, = subsample_data_for_validation(X_df, size=10)
+    assert_array_equal(X_df_s2.values, X_df_s.values)
+
+
+def test_get_accepted_features():
+    features = [Mock(source=f'feature_{i}') for i in range(3)]
+    proposed_feature = Mock(source='feature_1')
+
+    result = get_accepted_features(features, proposed_feature)
+    assert result == [features[0], features[2]]
+
+    with pytest.raises(BalletError):
+        get_accepted_features(features, Mock(source='feature_9'))
+
+    with pytest.raises(BalletError):
+        get_accepted_features(
+            features + [Mock(source='feature_1')], proposed_feature)
+
+
+def test_share_result():
+    mock = Mock(side_effect=lambda *args: object())
+    func = share_result(mock)
+    a, b = [1], [1]
+
+    with shared_results():
+        result = func(a)
+        assert func(a) is result
+
+        # arguments are compared by identity, not equality
+        assert func(b) is not result
+        assert mock.call_count == 2
+
+    # outside of the context, results are not shared
+    assert func(a) is not result
+    assert mock.call_count == 3
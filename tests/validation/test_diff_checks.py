@@ -56,6 +56,13 @@ def test_within_contrib_check(project):
     mock_diff = Mock(b_path='foo/hack.py')
     assert not checker.do_check(mock_diff)
 
+    # a sibling directory sharing the contrib path as a prefix is not within
+    mock_diff = Mock(b_path=f'{contrib_path}_other/user_bob/feature_1.py')
+    assert not checker.do_check(mock_diff)
+
+    mock_diff = Mock(b_path=contrib_path)
+    assert not checker.do_check(mock_diff)
+
 
 def test_subpackage_name_check(project):
     contrib_path = project.config.get('contrib.module_path')
@@ -8,10 +8,11 @@ from ballet.util.testing import assert_array_equal
 from ballet.validation.entropy import (
     DISC_COL_UNIQUE_COUNT_THRESH, NEIGHBORS_ALGORITHM, NEIGHBORS_METRIC,
     _compute_empirical_probability, _compute_epsilon,
-    _compute_n_points_within_radius_i, _compute_volume_unit_ball,
-    _estimate_cont_entropy, _estimate_disc_entropy, _is_column_cont,
-    _is_column_disc, _make_neighbors, estimate_conditional_information,
-    estimate_entropy, estimate_mutual_information,)
+    _compute_log_volume_unit_ball, _compute_n_points_within_radius,
+    _compute_volume_unit_ball, _estimate_cont_entropy, _estimate_disc_entropy,
+    _is_column_cont, _is_column_disc, _make_neighbors,
+    estimate_conditional_information, estimate_entropy,
+    estimate_mutual_information,)
 
 
 def test_make_neighbors():
@@ -20,9 +21,8 @@ def test_make_neighbors():
     assert NEIGHBORS_METRIC == nn.metric
 
 
-def test_compute_nx_i():
+def test_compute_nx():
     # Note the chebyshev distance is used
-    n = 5
     x = np.array([
         [0, 0],
         [1, 0],
@@ -46,13 +46,8 @@ def test_compute_nx_i():
         1   # just 0.5, 0.5
     ])
 
-    nn = _make_neighbors().fit(x)
-    for i in range(n):
-        x_i = x[i:i + 1, :]  # require a (1,m) row array
-        radius_i = radius[i]
-        nx_i = _compute_n_points_within_radius_i(nn, x_i, radius_i)
-        expected_nx_i = expected_nx[i]
-        assert expected_nx_i == nx_i
+    nx = _compute_n_points_within_radius(x, radius)
+    assert_array_equal(expected_nx, nx)
 
 
 def test_compute_empirical_probability():
@@ -81,6 +76,17 @@ def test_compute_volume_unit_ball_euclidean():
         assert 0 < volume <= volume_upper_bound
 
 
+def test_compute_log_volume_unit_ball_euclidean():
+    metric = 'euclidean'
+    assert np.isclose(
+        np.log(np.pi / 4), _compute_log_volume_unit_ball(2, metric=metric))
+
+    # the volume itself underflows here, but its log is still finite
+    log_volume = _compute_log_volume_unit_ball(1000, metric=metric)
+    assert np.isfinite(log_volume)
+    assert log_volume < 0
+
+
 def test_compute_epsilon():
     # data looks like this:
     # |         x
@@ -5,7 +5,7 @@ from ballet.eng.base import BaseTransformer
 from ballet.eng.misc import IdentityTransformer
 from ballet.feature import Feature
 from ballet.util import has_nans
-from ballet.validation.common import check_from_class
+from ballet.validation.common import check_from_class, shared_results
 from ballet.validation.feature_api.checks import (
     CanDeepcopyCheck, CanTransformCheck, FeatureApiCheck,
     HasCorrectInputTypeCheck, HasCorrectOutputDimensionsCheck,
@@ -94,3 +94,36 @@ def test_producing_missing_values_fails(sample_data):
         FeatureApiCheck, feature, sample_data.X, sample_data.y)
     assert not valid
     assert NoMissingValuesCheck.__name__ in failures
+
+
+def test_shared_results(sample_data, mock_feature_pipeline):
+    feature = Feature(
+        input='size',
+        transformer=SimpleImputer(),
+    )
+    checks = [
+        Checker(sample_data.X, sample_data.y)
+        for Checker in (HasCorrectOutputDimensionsCheck,
+                        NoMissingValuesCheck)
+    ]
+
+    with shared_results():
+        assert all(check.do_check(feature) for check in checks)
+    assert mock_feature_pipeline.call_count == 1
+
+    # outside of the context, results are not shared
+    assert all(check.do_check(feature) for check in checks)
+    assert mock_feature_pipeline.call_count == 3
+
+
+def test_check_from_class_fail_fast(sample_data):
+    feature = Feature(
+        input=3,
+        transformer=SimpleImputer(),
+    )
+    valid, failures, advice = check_from_class(
+        FeatureApiCheck, feature, sample_data.X, sample_data.y,
+        fail_fast=True)
+    assert not valid
+    assert failures == [HasCorrectInputTypeCheck.__name__]
+    assert len(advice) == 1
@@ -7,8 +7,9 @@ import ballet.util.log
 from ballet.exc import SkippedValidationTest
 from ballet.validation.main import (  # noqa F401
     _check_project_structure, _evaluate_feature_performance,
-    _load_validator_class_params, _prune_existing_features,
-    _validate_feature_api, validate, validation_stage,)
+    _load_validation_data, _load_validator_class_params,
+    _prune_existing_features, _validate_feature_api, validate,
+    validation_stage,)
 from ballet.validation.project_structure.validator import (
     ProjectStructureValidator,)
 
@@ -99,3 +100,29 @@ def test_prune_existing_features():
 @pytest.mark.xfail
 def test_validate():
     raise NotImplementedError
+
+
+def test_load_validation_data_reuses_default_data():
+    X_df, y_df = Mock(), Mock()
+    project = Mock()
+    project.api.load_data = Mock(spec=lambda: None)
+
+    X_df_val, y_df_val = _load_validation_data(project, X_df, y_df)
+    assert X_df_val is X_df
+    assert y_df_val is y_df
+    project.api.load_data.assert_not_called()
+
+
+def test_load_validation_data_split():
+    X_df, y_df = Mock(), Mock()
+    project = Mock()
+    project.config.validation.split = 'val'
+    X_df_val, y_df_val = Mock(), Mock()
+
+    def load_data(split='train'):
+        assert split == 'val'
+        return X_df_val, y_df_val
+
+    project.api.load_data = load_data
+
+    assert _load_validation_data(project, X_df, y_df) == (X_df_val, y_df_val)
@@ -9,7 +9,8 @@ import pytest
 from ballet.exc import BalletError
 from ballet.project import Project
 from ballet.util.git import CustomDiffer, Differ
-from ballet.validation.common import ChangeCollector, NewFeatureInfo
+from ballet.validation.common import (
+    ChangeCollector, NewFeatureInfo, make_checkers,)
 from ballet.validation.feature_api.validator import FeatureApiValidator
 from ballet.validation.project_structure.validator import (
     ProjectStructureValidator,)
@@ -126,7 +127,14 @@ def test_change_collector_collect_changes(quickstart):
 
     differ = CustomDiffer(endpoints=(old_head, new_head))
     change_collector = ChangeCollector(quickstart.project, differ=differ)
-    changes = change_collector.collect_changes()
+    with patch(
+        'ballet.validation.common.make_checkers',
+        side_effect=make_checkers,
+    ) as mock_make_checkers:
+        changes = change_collector.collect_changes()
+
+    # the project structure checkers are created once, not once per diff
+    mock_make_checkers.assert_called_once()
 
     assert len(changes.file_diffs) == 5
     assert len(changes.candidate_feature_diffs) == 1
@@ -187,6 +195,9 @@ def test_feature_api_validator_validation_failure_no_features_found(
     result = validator.validate()
     assert not result
 
+    # no data is loaded when there is nothing to validate
+    project.api.load_data.assert_not_called()
+
 
 @patch(
     'ballet.validation.feature_api.validator.validate_feature_api',